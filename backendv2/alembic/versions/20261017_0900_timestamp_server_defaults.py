@@ -0,0 +1,46 @@
+"""timestamp_server_defaults
+
+Revision ID: 3c1f6a9d2b47
+Revises: ee5ff9f5f751
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f6a9d2b47'
+down_revision: Union[str, None] = 'ee5ff9f5f751'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+# (table, columns) stamped by Postgres instead of datetime.utcnow()
+TIMESTAMP_COLUMNS = [
+    ('users', ['created_at', 'updated_at']),
+    ('workspaces', ['created_at', 'updated_at']),
+    ('workspace_members', ['created_at', 'updated_at']),
+    ('folders', ['created_at', 'updated_at']),
+    ('documents', ['created_at', 'updated_at']),
+    ('document_snapshots', ['created_at']),
+    ('invitations', ['created_at']),
+    ('share_links', ['created_at']),
+    ('audit_logs', ['created_at']),
+]
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS:
+        for column in columns:
+            op.alter_column(table, column, server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS:
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
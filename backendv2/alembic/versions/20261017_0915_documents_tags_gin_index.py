@@ -0,0 +1,26 @@
+"""documents_tags_gin_index
+
+Revision ID: 8e2d4b7a1f90
+Revises: 3c1f6a9d2b47
+Create Date: 2026-10-17 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2d4b7a1f90'
+down_revision: Union[str, None] = '3c1f6a9d2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_documents_tags', 'documents', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_tags', table_name='documents', postgresql_using='gin')
@@ -0,0 +1,51 @@
+"""drop_redundant_indexes
+
+Revision ID: 5b7c9e2f4a13
+Revises: 8e2d4b7a1f90
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7c9e2f4a13'
+down_revision: Union[str, None] = '8e2d4b7a1f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - each duplicates a primary key, a unique
+# index or the leading column of a composite index on the same table,
+# except ix_workspaces_slug: no index leads with slug afterwards, but every
+# slug lookup also filters on owner_id, which ix_workspaces_owner_slug
+# (owner_id, slug) serves
+REDUNDANT_INDEXES = [
+    ('ix_users_id', 'users', ['id']),
+    ('ix_users_email_active', 'users', ['email', 'is_active']),
+    ('ix_users_username_active', 'users', ['username', 'is_active']),
+    ('ix_workspaces_id', 'workspaces', ['id']),
+    ('ix_workspaces_slug', 'workspaces', ['slug']),
+    ('ix_workspaces_owner_id', 'workspaces', ['owner_id']),
+    ('ix_folders_id', 'folders', ['id']),
+    ('ix_folders_workspace_id', 'folders', ['workspace_id']),
+    ('ix_folders_parent_id', 'folders', ['parent_id']),
+    ('ix_workspace_members_id', 'workspace_members', ['id']),
+    ('ix_workspace_members_workspace_id', 'workspace_members', ['workspace_id']),
+    ('ix_documents_id', 'documents', ['id']),
+    ('ix_documents_workspace_id', 'documents', ['workspace_id']),
+    ('ix_documents_created_by_id', 'documents', ['created_by_id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, columns, unique=False)
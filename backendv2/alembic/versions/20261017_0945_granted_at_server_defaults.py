@@ -0,0 +1,33 @@
+"""granted_at_server_defaults
+
+Revision ID: 9f3a6c1d8e25
+Revises: 5b7c9e2f4a13
+Create Date: 2026-10-17 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3a6c1d8e25'
+down_revision: Union[str, None] = '5b7c9e2f4a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+GRANTED_AT_TABLES = ['workspace_members', 'document_shares']
+
+
+def upgrade() -> None:
+    for table in GRANTED_AT_TABLES:
+        op.alter_column(table, 'granted_at', server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table in GRANTED_AT_TABLES:
+        op.alter_column(table, 'granted_at', server_default=None)
@@ -0,0 +1,38 @@
+"""partial_active_indexes
+
+Revision ID: 2d8e4f6a0b17
+Revises: 9f3a6c1d8e25
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d8e4f6a0b17'
+down_revision: Union[str, None] = '9f3a6c1d8e25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_folders_workspace_active', 'folders',
+        ['workspace_id', 'parent_id', 'position'], unique=False,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+    op.drop_index('ix_workspaces_owner_active', table_name='workspaces')
+    op.create_index(
+        'ix_workspaces_owner_active', 'workspaces',
+        ['owner_id', 'updated_at'], unique=False,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workspaces_owner_active', table_name='workspaces')
+    op.create_index('ix_workspaces_owner_active', 'workspaces', ['owner_id', 'is_deleted'], unique=False)
+    op.drop_index('ix_folders_workspace_active', table_name='folders')
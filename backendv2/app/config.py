@@ -15,7 +15,8 @@ Security:
 - Validation for required fields
 """
 
-from typing import List
+from functools import cached_property
+from typing import FrozenSet, List
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import json
@@ -61,8 +62,24 @@ class Settings(BaseSettings):
     # Connection pool settings (Pattern: Connection Pooling)
     DB_POOL_SIZE: int = Field(default=20)
     DB_MAX_OVERFLOW: int = Field(default=10)
-    DB_POOL_TIMEOUT: int = Field(default=30)
-    DB_POOL_RECYCLE: int = Field(default=3600)  # 1 hour
+    DB_POOL_TIMEOUT: int = Field(default=5)  # Fail fast when the pool is saturated
+    DB_POOL_RECYCLE: int = Field(default=300)  # 5 minutes (cheap vs. pre-ping)
+    DB_POOL_PREWARM: bool = Field(default=True)  # Open pool_size connections on startup
+    DB_POOL_USE_LIFO: bool = Field(default=True)  # Reuse hottest connection; idle tail ages out
+    
+    # TCP keepalive for pooled connections (detects dead peers without pre-ping)
+    DB_TCP_KEEPALIVES_IDLE: int = Field(default=30)
+    DB_TCP_KEEPALIVES_INTERVAL: int = Field(default=10)
+    DB_TCP_KEEPALIVES_COUNT: int = Field(default=3)
+    
+    # Compiled SQL cache (SQLAlchemy default is 500 statements)
+    DB_QUERY_CACHE_SIZE: int = Field(default=1200, ge=0)
+    
+    # asyncpg prepared statements kept per connection (driver default is 100)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(default=500, ge=0)
+    
+    # Background connectivity probe backing /health (seconds)
+    DB_HEALTH_PROBE_INTERVAL: int = Field(default=5, ge=1)
     
     # =========================================
     # Redis (Phase 1 - Read-Through Cache Pattern)
@@ -84,21 +101,43 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7)
     
+    # Verified-token cache (skips signature check on repeated requests)
+    TOKEN_CACHE_TTL_SECONDS: int = Field(default=5, ge=0)
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=10000, ge=1)
+    
     # =========================================
     # CORS (Security)
     # =========================================
     CORS_ORIGINS: List[str] = Field(
         default=["http://localhost:5173", "http://localhost:5174"]
     )
+    CORS_ALLOW_METHODS: List[str] = Field(
+        default=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"]
+    )
+    CORS_ALLOW_HEADERS: List[str] = Field(default=["*"])
+    CORS_EXPOSE_HEADERS: List[str] = Field(
+        default=["Content-Length", "X-Total-Count"]
+    )
     
-    @field_validator("CORS_ORIGINS", mode="before")
+    @field_validator(
+        "CORS_ORIGINS",
+        "CORS_ALLOW_METHODS",
+        "CORS_ALLOW_HEADERS",
+        "CORS_EXPOSE_HEADERS",
+        mode="before",
+    )
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS_ORIGINS from JSON string if needed"""
+        """Parse CORS lists from JSON string if needed"""
         if isinstance(v, str):
             return json.loads(v)
         return v
     
+    # =========================================
+    # Response Compression
+    # =========================================
+    GZIP_MINIMUM_SIZE: int = Field(default=1024, ge=0)  # Bytes; smaller bodies sent as-is
+    
     # =========================================
     # Security (SECURITY_CHECKLIST.md - Password Policy)
     # =========================================
@@ -183,21 +222,28 @@ class Settings(BaseSettings):
     # =========================================
     # Computed Properties
     # =========================================
+    # Settings are immutable after startup, so derived values are computed
+    # once and stored on the instance (cached_property).
     
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production"""
         return self.ENVIRONMENT.lower() == "production"
     
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development"""
         return self.ENVIRONMENT.lower() == "development"
     
-    @property
+    @cached_property
     def max_upload_size_bytes(self) -> int:
         """Get max upload size in bytes"""
         return self.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+    
+    @cached_property
+    def cors_origins_set(self) -> FrozenSet[str]:
+        """CORS origins as a set (O(1) origin checks in error handlers)"""
+        return frozenset(self.CORS_ORIGINS)
 
 
 # =========================================
@@ -14,15 +14,17 @@ Benefits:
 - Transaction management
 """
 
-from typing import AsyncGenerator
-from sqlalchemy import text
+from typing import AsyncGenerator, Dict, Optional
+import asyncio
+
+from sqlalchemy import func, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker
 )
-from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config import settings
 
@@ -30,7 +32,28 @@ from app.config import settings
 # =========================================
 # Base Model (all models inherit from this)
 # =========================================
-Base = declarative_base()
+class Base(DeclarativeBase):
+    """
+    SQLAlchemy 2.0 declarative base
+    
+    Supports both typed Mapped[...] / mapped_column() declarations and the
+    legacy Column() style still used by some models.
+    
+    eager_defaults: server-generated values (timestamps) are fetched with
+    RETURNING on INSERT/UPDATE, so they are readable after commit without
+    a reload (AsyncSession cannot lazy-load expired attributes).
+    """
+    __mapper_args__ = {"eager_defaults": True}
+
+
+def utc_now():
+    """
+    Server-side UTC timestamp for naive DateTime columns
+    
+    Used as server_default/onupdate so Postgres stamps rows itself. Columns
+    stay timezone-naive UTC to match datetime.utcnow() used across services.
+    """
+    return func.timezone("utc", func.now())
 
 
 # =========================================
@@ -40,19 +63,49 @@ Base = declarative_base()
 # Connection pooling configuration (PATTERNS_ADOPTION.md)
 # - pool_size: Number of permanent connections
 # - max_overflow: Additional connections when pool exhausted
-# - pool_timeout: Wait time for available connection
+# - pool_timeout: Wait time for available connection (short, so saturation
+#   surfaces as errors instead of 30s hangs)
 # - pool_recycle: Recycle connections after N seconds (prevent stale connections)
+# - pool_use_lifo: Hand out the most recently returned connection, so under
+#   light load the surplus connections sit idle and get recycled
+# - query_cache_size: Compiled-statement LRU (avoids re-compiling hot queries)
+# - prepared_statement_cache_size: asyncpg server-side prepared statements
+#   kept per connection (hot queries skip Parse/Describe)
+# - pool_pre_ping: Off - a SELECT 1 per checkout costs a round trip on every
+#   request; short pool_recycle + server-side TCP keepalives catch dead
+#   connections instead (asyncpg has no libpq keepalive options, so the
+#   tcp_keepalives_* GUCs are set per connection)
+
+# Use NullPool for testing, AsyncAdaptedQueuePool (the asyncio-safe QueuePool)
+# for production. Sizing options only
+# apply to the queue pool (NullPool rejects them), so they are passed only there.
+if settings.ENVIRONMENT == "test":
+    _pool_options = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # Log SQL queries in development
     future=True,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    # Use NullPool for testing, QueuePool for production
-    poolclass=NullPool if settings.ENVIRONMENT == "test" else QueuePool,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    pool_pre_ping=False,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "tcp_keepalives_idle": str(settings.DB_TCP_KEEPALIVES_IDLE),
+            "tcp_keepalives_interval": str(settings.DB_TCP_KEEPALIVES_INTERVAL),
+            "tcp_keepalives_count": str(settings.DB_TCP_KEEPALIVES_COUNT),
+        },
+    },
+    **_pool_options,
 )
 
 
@@ -123,6 +176,88 @@ async def check_db_connection() -> bool:
         return False
 
 
+# =========================================
+# Background Health Probe
+# =========================================
+# K8s polls /health every few seconds per replica. Instead of checking out
+# a connection for each poll, a background task refreshes this flag and the
+# endpoint just reads it.
+
+_db_healthy: Optional[bool] = None  # None = probe not running
+
+
+async def run_db_health_probe(interval: float) -> None:
+    """
+    Periodically refresh the cached database health flag
+    
+    Started by main.py lifespan; runs until cancelled on shutdown.
+    
+    Args:
+        interval: Seconds between probes
+    """
+    global _db_healthy
+    try:
+        while True:
+            _db_healthy = await check_db_connection()
+            await asyncio.sleep(interval)
+    finally:
+        _db_healthy = None
+
+
+def get_db_health() -> Optional[bool]:
+    """
+    Get last probed database health
+    
+    Returns:
+        True/False from the latest probe, None if the probe is not running
+    """
+    return _db_healthy
+
+
+def get_pool_status() -> Optional[Dict[str, int]]:
+    """
+    Snapshot of connection pool usage (exported on /health)
+    
+    Returns:
+        Pool counters, or None when pooling is disabled (NullPool in tests)
+    """
+    pool = engine.pool
+    if isinstance(pool, NullPool):
+        return None
+    
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
+
+# =========================================
+# Pool Warm-up
+# =========================================
+
+async def prewarm_pool() -> int:
+    """
+    Open pool_size connections concurrently so the first burst of
+    requests doesn't pay connect/auth handshakes serially
+    
+    Connections are checked out together (forcing distinct connections)
+    and immediately returned to the pool.
+    
+    Returns:
+        Number of connections opened
+    """
+    if isinstance(engine.pool, NullPool):
+        return 0
+    
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DB_POOL_SIZE))
+    )
+    await asyncio.gather(*(conn.close() for conn in connections))
+    return len(connections)
+
+
 # =========================================
 # Lifespan Integration
 # =========================================
@@ -142,6 +277,11 @@ async def init_db():
     print("✅ Database connection established")
     print(f"   Pool size: {settings.DB_POOL_SIZE}")
     print(f"   Max overflow: {settings.DB_MAX_OVERFLOW}")
+    
+    # Warm the pool (concurrent handshakes instead of on first requests)
+    if settings.DB_POOL_PREWARM:
+        warmed = await prewarm_pool()
+        print(f"   Pre-warmed connections: {warmed}")
 
 
 async def close_db():
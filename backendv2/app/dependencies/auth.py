@@ -18,8 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.services.auth_service import AuthService
 from app.models.user import User
-from app.utils.security import decode_token
-from jose import JWTError
+from app.utils.security import verify_token_fast
 
 
 # =========================================
@@ -62,6 +61,39 @@ async def get_auth_service(
     return AuthService(db)
 
 
+# =========================================
+# Token → User Resolution (shared by required/optional auth)
+# =========================================
+
+async def _resolve_user(
+    token: str,
+    auth_service: AuthService
+) -> Optional[User]:
+    """
+    Resolve a bearer token to its user without raising
+    
+    Args:
+        token: Raw JWT access token
+        auth_service: AuthService instance
+        
+    Returns:
+        User (active or not) or None if the token is invalid or the user
+        no longer exists
+    """
+    # 1-3. Verify signature, expiry, token type and sub claim in one pass
+    #      (cached for a few seconds - see verify_token_fast)
+    verified = verify_token_fast(token)
+    if verified is None:
+        return None
+    
+    # TODO Phase 1: Check if token is blacklisted (logged out)
+    # if await is_token_blacklisted(jti):
+    #     return None
+    
+    # 4. Get user from database
+    return await auth_service.get_user_by_id(verified[0])
+
+
 # =========================================
 # Dependency: Get Current User (Protected Routes)
 # =========================================
@@ -98,57 +130,23 @@ async def get_current_user(
         ):
             return {"user_id": current_user.id}
     """
-    token = credentials.credentials
+    user = await _resolve_user(credentials.credentials, auth_service)
     
-    try:
-        # 1. Decode and validate token
-        payload = decode_token(token)
-        
-        # 2. Extract user ID and token type
-        user_id: Optional[str] = payload.get("sub")
-        token_type: Optional[str] = payload.get("type")
-        jti: Optional[str] = payload.get("jti")
-        
-        if user_id is None or token_type != "access":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # TODO Phase 1: Check if token is blacklisted (logged out)
-        # if await is_token_blacklisted(jti):
-        #     raise HTTPException(
-        #         status_code=status.HTTP_401_UNAUTHORIZED,
-        #         detail="Token has been revoked",
-        #         headers={"WWW-Authenticate": "Bearer"},
-        #     )
-        
-        # 3. Get user from database
-        user = await auth_service.get_user_by_id(user_id)
-        
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # 4. Check if user is active
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Account is suspended",
-            )
-        
-        return user
-        
-    except JWTError as e:
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    # 5. Check if user is active
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is suspended",
+        )
+    
+    return user
 
 
 # =========================================
@@ -185,8 +183,9 @@ async def get_current_user_optional(
     if credentials is None:
         return None
     
-    try:
-        return await get_current_user(credentials, auth_service)
-    except HTTPException:
+    # No exception round-trip: anonymous/invalid tokens simply yield None
+    user = await _resolve_user(credentials.credentials, auth_service)
+    if user is None or not user.is_active:
         return None
+    return user
 
@@ -15,17 +15,26 @@ Architecture:
 - APIs from API_CONTRACTS.md
 """
 
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+import asyncio
 import logging
 import traceback
 
 from app.config import settings
-from app.database import init_db, close_db
+from app.database import (
+    init_db,
+    close_db,
+    check_db_connection,
+    get_db_health,
+    get_pool_status,
+    run_db_health_probe,
+)
 
 
 # =========================================
@@ -75,11 +84,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"   Debug: {settings.DEBUG}")
     logger.info("=" * 60)
     
+    health_probe_task = None
+    
     try:
         # Initialize database
         logger.info("📊 Initializing database...")
         await init_db()
         
+        # Keep /health off the connection pool (background probe)
+        health_probe_task = asyncio.create_task(
+            run_db_health_probe(settings.DB_HEALTH_PROBE_INTERVAL)
+        )
+        
         # TODO Phase 1: Initialize Redis
         # logger.info("💾 Initializing Redis cache...")
         # await init_redis()
@@ -111,6 +127,12 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 60)
     
     try:
+        # Stop health probe before the pool goes away
+        if health_probe_task is not None:
+            health_probe_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await health_probe_task
+        
         # Close database connections
         logger.info("📊 Closing database connections...")
         await close_db()
@@ -147,6 +169,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,  # ← Attach lifespan
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,  # orjson: faster than stdlib json
 )
 
 
@@ -158,13 +181,22 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["Content-Length", "X-Total-Count"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=settings.CORS_EXPOSE_HEADERS,
     max_age=600,  # Cache preflight for 10 minutes
 )
 
 
+# =========================================
+# GZip Middleware
+# =========================================
+# List payloads repeat the same keys per item and compress well; small
+# bodies stay uncompressed (not worth the CPU).
+
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
+
 # =========================================
 # Security Headers Middleware (SECURITY_CHECKLIST.md - Section 12)
 # =========================================
@@ -213,26 +245,36 @@ async def health_check():
     """
     Health check endpoint for K8s liveness probe
     
+    Reads the flag maintained by the background probe (no I/O per request).
+    
     Returns:
         200: Service is healthy
         503: Service is unhealthy
     """
-    from app.database import check_db_connection
+    db_healthy = get_db_health()
     
-    db_healthy = await check_db_connection()
+    if db_healthy is None:
+        # Probe not running (e.g. app served without lifespan) - check directly
+        db_healthy = await check_db_connection()
     
     if not db_healthy:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unhealthy", "database": "down"}
         )
     
-    return {
+    content = {
         "status": "healthy",
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
         "database": "up",
     }
+    
+    pool_status = get_pool_status()
+    if pool_status is not None:
+        content["pool"] = pool_status
+    
+    return ORJSONResponse(content)
 
 
 @app.get("/", tags=["Root"])
@@ -253,7 +295,7 @@ async def root():
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions with CORS headers"""
     origin = request.headers.get("origin")
-    if origin and origin in settings.CORS_ORIGINS:
+    if origin and origin in settings.cors_origins_set:
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": exc.detail},
@@ -272,7 +314,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors with CORS headers"""
     origin = request.headers.get("origin")
-    if origin and origin in settings.CORS_ORIGINS:
+    if origin and origin in settings.cors_origins_set:
         return JSONResponse(
             status_code=422,
             content={"detail": exc.errors()},
@@ -295,7 +337,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     origin = request.headers.get("origin")
     error_detail = str(exc) if settings.DEBUG else "Internal server error"
     
-    if origin and origin in settings.CORS_ORIGINS:
+    if origin and origin in settings.cors_origins_set:
         return JSONResponse(
             status_code=500,
             content={
@@ -6,7 +6,6 @@ Pattern: Three-Layer Architecture (Model layer)
 Purpose: Audit trail for sharing and snapshot actions
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, DateTime, ForeignKey,
     Index
@@ -15,7 +14,7 @@ from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class AuditLog(Base):
@@ -100,7 +99,7 @@ class AuditLog(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         index=True
     )
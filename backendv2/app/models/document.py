@@ -9,17 +9,27 @@ Features: Yjs collaboration support, storage modes, starred docs
 
 from datetime import datetime
 from sqlalchemy import (
-    Column, String, Boolean, Integer, DateTime, ForeignKey,
+    String, Boolean, Integer, DateTime, ForeignKey,
     Index, Text, Enum as SQLEnum, LargeBinary
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 import enum
 import base64
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from app.database import Base
+from app.database import Base, utc_now
+
+if TYPE_CHECKING:
+    from app.models.workspace import Workspace
+    from app.models.folder import Folder
+    from app.models.user import User
+    from app.models.document_share import DocumentShare
+    from app.models.invitation import Invitation
+    from app.models.share_link import ShareLink
+    from app.models.document_snapshot import DocumentSnapshot
+    from app.models.audit_log import AuditLog
 
 
 class StorageMode(str, enum.Enum):
@@ -88,38 +98,37 @@ class Document(Base):
     # =========================================
     # Primary Key
     # =========================================
-    id = Column(
+    id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # =========================================
     # Document Fields
     # =========================================
-    title = Column(
+    title: Mapped[str] = mapped_column(
         String(200),
         nullable=False,
         doc="Document title (1-200 chars)"
     )
     
-    slug = Column(
+    slug: Mapped[str] = mapped_column(
         String(200),
         nullable=False,
         index=True,
         doc="URL-friendly slug"
     )
     
-    content = Column(
+    content: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
         default="",
         doc="Markdown/HTML content (metadata only, Yjs handles real content)"
     )
     
-    content_type = Column(
+    content_type: Mapped[str] = mapped_column(
         String(20),
         default="markdown",
         nullable=False,
@@ -129,15 +138,14 @@ class Document(Base):
     # =========================================
     # Relationships (Foreign Keys)
     # =========================================
-    workspace_id = Column(
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="Parent workspace"
     )
     
-    folder_id = Column(
+    folder_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("folders.id", ondelete="SET NULL"),
         nullable=True,
@@ -145,25 +153,24 @@ class Document(Base):
         doc="Optional parent folder"
     )
     
-    created_by_id = Column(
+    created_by_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="User who created this document"
     )
     
     # =========================================
     # Metadata
     # =========================================
-    tags = Column(
+    tags: Mapped[List[str]] = mapped_column(
         ARRAY(String),
         default=[],
         nullable=False,
         doc="Array of tags for organization"
     )
     
-    is_public = Column(
+    is_public: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
@@ -171,7 +178,7 @@ class Document(Base):
         doc="Public visibility flag"
     )
     
-    is_template = Column(
+    is_template: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
@@ -179,7 +186,7 @@ class Document(Base):
         doc="Template flag (for template library)"
     )
     
-    is_starred = Column(
+    is_starred: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
@@ -190,7 +197,7 @@ class Document(Base):
     # =========================================
     # Storage Mode (Phase 2)
     # =========================================
-    storage_mode = Column(
+    storage_mode: Mapped[StorageMode] = mapped_column(
         SQLEnum(StorageMode),
         default=StorageMode.HYBRID_SYNC,
         nullable=False,
@@ -201,7 +208,7 @@ class Document(Base):
     # =========================================
     # Permission Inheritance (Phase 4 - Workspace Permissions)
     # =========================================
-    access_model = Column(
+    access_model: Mapped[DocumentAccessModel] = mapped_column(
         SQLEnum(DocumentAccessModel, name='document_access_model', create_type=False),
         default=DocumentAccessModel.INHERITED,
         nullable=False,
@@ -212,27 +219,27 @@ class Document(Base):
     # =========================================
     # Versioning
     # =========================================
-    version = Column(
+    version: Mapped[int] = mapped_column(
         Integer,
         default=1,
         nullable=False,
         doc="Document version (optimistic locking for metadata)"
     )
     
-    yjs_version = Column(
+    yjs_version: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
         doc="Yjs document version (for collaboration state)"
     )
 
-    yjs_state = Column(
+    yjs_state: Mapped[Optional[bytes]] = mapped_column(
         LargeBinary,
         nullable=True,
         doc="Yjs collaboration state (Phase 1)"
     )
 
-    size = Column(
+    size: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
@@ -242,7 +249,7 @@ class Document(Base):
     # =========================================
     # Computed Fields (cached)
     # =========================================
-    word_count = Column(
+    word_count: Mapped[int] = mapped_column(
         Integer,
         default=0,
         nullable=False,
@@ -252,7 +259,7 @@ class Document(Base):
     # =========================================
     # Status Fields
     # =========================================
-    is_deleted = Column(
+    is_deleted: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
@@ -263,17 +270,17 @@ class Document(Base):
     # =========================================
     # Timestamps
     # =========================================
-    created_at = Column(
+    created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         index=True
     )
     
-    updated_at = Column(
+    updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False,
         index=True
     )
@@ -281,18 +288,18 @@ class Document(Base):
     # =========================================
     # Relationships
     # =========================================
-    workspace = relationship("Workspace", back_populates="documents")
-    folder = relationship("Folder", back_populates="documents")
-    created_by = relationship("User", back_populates="documents")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="documents")
+    folder: Mapped[Optional["Folder"]] = relationship("Folder", back_populates="documents")
+    created_by: Mapped["User"] = relationship("User", back_populates="documents")
     
     # Permissions & Sharing (Phase 3)
-    shares = relationship("DocumentShare", back_populates="document", cascade="all, delete-orphan")
-    invitations = relationship("Invitation", back_populates="document", cascade="all, delete-orphan")
-    share_links = relationship("ShareLink", back_populates="document", cascade="all, delete-orphan")
+    shares: Mapped[List["DocumentShare"]] = relationship("DocumentShare", back_populates="document", cascade="all, delete-orphan")
+    invitations: Mapped[List["Invitation"]] = relationship("Invitation", back_populates="document", cascade="all, delete-orphan")
+    share_links: Mapped[List["ShareLink"]] = relationship("ShareLink", back_populates="document", cascade="all, delete-orphan")
     
     # Version History (Phase 3)
-    snapshots = relationship("DocumentSnapshot", back_populates="document", cascade="all, delete-orphan")
-    audit_logs = relationship("AuditLog", back_populates="document", cascade="all, delete-orphan")
+    snapshots: Mapped[List["DocumentSnapshot"]] = relationship("DocumentSnapshot", back_populates="document", cascade="all, delete-orphan")
+    audit_logs: Mapped[List["AuditLog"]] = relationship("AuditLog", back_populates="document", cascade="all, delete-orphan")
     
     # =========================================
     # Indexes
@@ -301,6 +308,8 @@ class Document(Base):
         Index('ix_documents_workspace_folder', 'workspace_id', 'folder_id'),
         Index('ix_documents_workspace_starred', 'workspace_id', 'is_starred'),
         Index('ix_documents_created_by', 'created_by_id'),
+        # Tag filter (tags && ARRAY[...]) in list_documents
+        Index('ix_documents_tags', 'tags', postgresql_using='gin'),
     )
     
     # =========================================
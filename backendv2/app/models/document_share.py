@@ -17,7 +17,6 @@ Principal Types:
 - workspace: Workspace-wide access (future feature)
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Boolean, DateTime, ForeignKey,
     Index, CheckConstraint, UniqueConstraint
@@ -26,7 +25,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class DocumentShare(Base):
@@ -120,7 +119,7 @@ class DocumentShare(Base):
     # =========================================
     granted_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         doc="When permission was granted"
     )
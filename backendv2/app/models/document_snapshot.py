@@ -13,7 +13,6 @@ CRITICAL CONSTRAINTS:
 - Default restore action is "restore-as-new"
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, BigInteger, DateTime, ForeignKey, Text,
     Index, CheckConstraint
@@ -22,7 +21,7 @@ from sqlalchemy.dialects.postgresql import UUID, BYTEA
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class DocumentSnapshot(Base):
@@ -118,7 +117,7 @@ class DocumentSnapshot(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         index=True
     )
@@ -7,7 +7,6 @@ Security: Optimistic locking, soft delete
 Features: Hierarchical structure, drag-and-drop support
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Boolean, Integer, DateTime, ForeignKey, Index
 )
@@ -15,7 +14,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class Folder(Base):
@@ -57,8 +56,7 @@ class Folder(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # =========================================
@@ -90,7 +88,6 @@ class Folder(Base):
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="Parent workspace"
     )
     
@@ -98,7 +95,6 @@ class Folder(Base):
         UUID(as_uuid=True),
         ForeignKey("folders.id", ondelete="CASCADE"),
         nullable=True,
-        index=True,
         doc="Optional parent folder (for hierarchy)"
     )
     
@@ -146,15 +142,15 @@ class Folder(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         index=True
     )
     
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False
     )
     
@@ -184,6 +180,12 @@ class Folder(Base):
     __table_args__ = (
         Index('ix_folders_workspace_parent', 'workspace_id', 'parent_id'),
         Index('ix_folders_parent_position', 'parent_id', 'position'),
+        # Tree/list rendering: live folders only, already in sibling order
+        Index(
+            'ix_folders_workspace_active',
+            'workspace_id', 'parent_id', 'position',
+            postgresql_where=(is_deleted == False)
+        ),
     )
     
     def __repr__(self) -> str:
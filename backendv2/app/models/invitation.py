@@ -6,7 +6,6 @@ Pattern: Three-Layer Architecture (Model layer)
 Purpose: Pending email invitations for document sharing
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, DateTime, ForeignKey, Text,
     Index, CheckConstraint
@@ -15,7 +14,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class Invitation(Base):
@@ -111,7 +110,7 @@ class Invitation(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False
     )
     
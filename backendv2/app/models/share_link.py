@@ -6,7 +6,6 @@ Pattern: Three-Layer Architecture (Model layer)
 Purpose: Shareable links with tokens for document access
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Integer, DateTime, ForeignKey,
     Index, CheckConstraint
@@ -15,7 +14,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class ShareLink(Base):
@@ -110,7 +109,7 @@ class ShareLink(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False
     )
     
@@ -14,15 +14,15 @@ Patterns Applied (PATTERNS_ADOPTION.md):
 ✅ Three-Layer Architecture - Model only, no business logic
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Boolean, Integer, DateTime, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from operator import attrgetter
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class User(Base):
@@ -62,8 +62,7 @@ class User(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # =========================================
@@ -140,15 +139,15 @@ class User(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         doc="Account creation timestamp"
     )
     
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False,
         doc="Last update timestamp"
     )
@@ -183,9 +182,8 @@ class User(Base):
     # =========================================
     # Indexes (for query performance)
     # =========================================
+    # email/username lookups are served by their unique indexes
     __table_args__ = (
-        Index('ix_users_email_active', 'email', 'is_active'),
-        Index('ix_users_username_active', 'username', 'is_active'),
         Index('ix_users_created_at', 'created_at'),
     )
     
@@ -202,14 +200,25 @@ class User(Base):
         
         Security: NEVER include hashed_password in API responses
         """
+        (
+            user_id, email, username, full_name, avatar_url,
+            is_active, created_at, updated_at
+        ) = _public_fields(self)
         return {
-            "id": str(self.id),
-            "email": self.email,
-            "username": self.username,
-            "full_name": self.full_name,
-            "avatar_url": self.avatar_url,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "id": str(user_id),
+            "email": email,
+            "username": username,
+            "full_name": full_name,
+            "avatar_url": avatar_url,
+            "is_active": is_active,
+            "created_at": created_at.isoformat(),
+            "updated_at": updated_at.isoformat(),
         }
 
+
+# Public (API-safe) columns fetched in one C-level call by User.to_dict
+_public_fields = attrgetter(
+    "id", "email", "username", "full_name", "avatar_url",
+    "is_active", "created_at", "updated_at"
+)
+
@@ -6,7 +6,6 @@ Pattern: Three-Layer Architecture (Model layer only)
 Security: Optimistic locking, soft delete
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Boolean, Integer, DateTime, ForeignKey, Index, Text
 )
@@ -14,7 +13,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class Workspace(Base):
@@ -48,8 +47,7 @@ class Workspace(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # =========================================
@@ -64,7 +62,6 @@ class Workspace(Base):
     slug = Column(
         String(100),
         nullable=False,
-        index=True,
         doc="URL-friendly slug (unique per owner)"
     )
     
@@ -96,7 +93,6 @@ class Workspace(Base):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="User who owns this workspace"
     )
     
@@ -126,14 +122,14 @@ class Workspace(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False
     )
     
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False
     )
     
@@ -164,7 +160,12 @@ class Workspace(Base):
     # =========================================
     __table_args__ = (
         Index('ix_workspaces_owner_slug', 'owner_id', 'slug', unique=True),
-        Index('ix_workspaces_owner_active', 'owner_id', 'is_deleted'),
+        # list_workspaces: live workspaces per owner, newest activity first
+        Index(
+            'ix_workspaces_owner_active',
+            'owner_id', 'updated_at',
+            postgresql_where=(is_deleted == False)
+        ),
     )
     
     def __repr__(self) -> str:
@@ -12,7 +12,6 @@ Architecture:
 - "Shared with me" = doc shares without workspace membership
 """
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, DateTime, ForeignKey, Index, Enum as SQLEnum
 )
@@ -21,7 +20,7 @@ from sqlalchemy.orm import relationship
 import uuid
 import enum
 
-from app.database import Base
+from app.database import Base, utc_now
 
 
 class WorkspaceRole(str, enum.Enum):
@@ -44,19 +43,31 @@ class WorkspaceRole(str, enum.Enum):
         """Enable role comparison for permission resolution."""
         if not isinstance(other, WorkspaceRole):
             return NotImplemented
-        order = [self.VIEWER, self.EDITOR, self.ADMIN, self.OWNER]
-        return order.index(self) < order.index(other)
+        return _WORKSPACE_ROLE_RANK[self] < _WORKSPACE_ROLE_RANK[other]
     
     def __le__(self, other):
-        return self == other or self < other
+        if not isinstance(other, WorkspaceRole):
+            return NotImplemented
+        return _WORKSPACE_ROLE_RANK[self] <= _WORKSPACE_ROLE_RANK[other]
     
     def __gt__(self, other):
         if not isinstance(other, WorkspaceRole):
             return NotImplemented
-        return not self <= other
+        return _WORKSPACE_ROLE_RANK[self] > _WORKSPACE_ROLE_RANK[other]
     
     def __ge__(self, other):
-        return self == other or self > other
+        if not isinstance(other, WorkspaceRole):
+            return NotImplemented
+        return _WORKSPACE_ROLE_RANK[self] >= _WORKSPACE_ROLE_RANK[other]
+
+
+# Role rank lookup (higher = more permissions); built once at import
+_WORKSPACE_ROLE_RANK = {
+    WorkspaceRole.VIEWER: 1,
+    WorkspaceRole.EDITOR: 2,
+    WorkspaceRole.ADMIN: 3,
+    WorkspaceRole.OWNER: 4,
+}
 
 
 class WorkspaceMember(Base):
@@ -94,8 +105,7 @@ class WorkspaceMember(Base):
         UUID(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # =========================================
@@ -105,7 +115,6 @@ class WorkspaceMember(Base):
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         doc="Workspace this membership belongs to"
     )
     
@@ -137,7 +146,7 @@ class WorkspaceMember(Base):
     
     granted_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False,
         doc="When membership was granted"
     )
@@ -161,14 +170,14 @@ class WorkspaceMember(Base):
     # =========================================
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utc_now(),
         nullable=False
     )
     
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False
     )
     
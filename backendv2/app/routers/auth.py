@@ -73,7 +73,9 @@ async def register(
     """
     try:
         result = await auth_service.register_user(user_data)
-        return RegisterResponse(**result)
+        # Service output is built from trusted DB rows: skip re-validation
+        result["user"] = UserResponse.model_construct(**result["user"])
+        return RegisterResponse.model_construct(**result)
         
     except ValueError as e:
         # Business logic error (email/username exists)
@@ -118,7 +120,9 @@ async def login(
     """
     try:
         result = await auth_service.login_user(login_data)
-        return LoginResponse(**result)
+        # Service output is built from trusted DB rows: skip re-validation
+        result["user"] = UserResponse.model_construct(**result["user"])
+        return LoginResponse.model_construct(**result)
         
     except ValueError as e:
         # Invalid credentials or inactive account
@@ -255,5 +259,5 @@ async def get_me(
     
     Requires: Valid JWT token in Authorization header
     """
-    return UserResponse(**current_user.to_dict())
+    return UserResponse.from_orm_trusted(current_user)
 
@@ -12,8 +12,10 @@ Pattern: Three-Layer Architecture (Router layer)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
+from uuid import UUID
 import base64
 
 from app.database import get_db
@@ -26,7 +28,6 @@ from app.schemas.document import (
     DocumentResponse,
     DocumentDetail,
     DocumentListResponse,
-    DocumentListItem,
     DocumentStarResponse,
     DocumentCreator,
     SortBy,
@@ -37,6 +38,37 @@ from app.schemas.document import (
 router = APIRouter(prefix="/api/v1/documents", tags=["Documents"])
 
 
+def _list_item(doc) -> dict:
+    """
+    Document list item as a plain dict (DocumentListItem shape)
+    
+    List endpoints return these through ORJSONResponse directly (orjson
+    encodes datetimes natively), so the per-item pydantic validation and
+    response_model re-serialization are skipped. The routes declare
+    DocumentListResponse through responses={200: ...} instead of
+    response_model, so it only feeds the OpenAPI schema.
+    
+    IDs are str()-ed: asyncpg hands back its own UUID subclass, which
+    orjson does not serialize.
+    """
+    return {
+        "id": str(doc.id),
+        "title": doc.title,
+        "slug": doc.slug,
+        "content_type": doc.content_type,
+        "workspace_id": str(doc.workspace_id),
+        "folder_id": str(doc.folder_id) if doc.folder_id else None,
+        "tags": doc.tags or [],
+        "is_starred": doc.is_starred or False,
+        "storage_mode": doc.storage_mode.value if doc.storage_mode else 'cloud',
+        "version": doc.version or 1,
+        "yjs_version": doc.yjs_version or 0,
+        "word_count": doc.word_count or 0,
+        "created_at": doc.created_at,
+        "updated_at": doc.updated_at,
+    }
+
+
 # =========================================
 # Document CRUD Endpoints
 # =========================================
@@ -49,7 +81,7 @@ router = APIRouter(prefix="/api/v1/documents", tags=["Documents"])
     description="Create a new document in a workspace. User must have access to workspace."
 )
 async def create_document(
-    workspace_id: str = Query(..., description="Workspace ID"),
+    workspace_id: UUID = Query(..., description="Workspace ID"),
     document_data: DocumentCreate = ...,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -74,7 +106,7 @@ async def create_document(
     
     try:
         document = await service.create_document(
-            workspace_id,
+            str(workspace_id),
             document_data,
             str(current_user.id)
         )
@@ -127,7 +159,7 @@ async def create_document(
 
 @router.get(
     "/shared-with-me",
-    response_model=DocumentListResponse,
+    responses={200: {"model": DocumentListResponse}},
     summary="List documents shared with me",
     description="List documents explicitly shared with the current user (doc-only access or restricted docs)."
 )
@@ -152,33 +184,15 @@ async def get_shared_with_me_documents(
     try:
         documents = await ShareService.list_shared_with_me_documents(db, current_user.id)
         
-        # Convert to response format
-        items = []
-        for doc in documents:
-            items.append(DocumentListItem(
-                id=str(doc.id),
-                title=doc.title,
-                slug=doc.slug,
-                content_type=doc.content_type,
-                workspace_id=str(doc.workspace_id),
-                folder_id=str(doc.folder_id) if doc.folder_id else None,
-                tags=doc.tags or [],
-                is_starred=doc.is_starred or False,
-                storage_mode=doc.storage_mode.value if doc.storage_mode else 'cloud',
-                version=doc.version or 1,
-                yjs_version=doc.yjs_version or 0,
-                word_count=doc.word_count or 0,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at
-            ))
+        items = [_list_item(doc) for doc in documents]
         
-        return DocumentListResponse(
-            items=items,
-            total=len(items),
-            page=page,
-            page_size=page_size,
-            has_more=False
-        )
+        return ORJSONResponse({
+            "items": items,
+            "total": len(items),
+            "page": page,
+            "page_size": page_size,
+            "has_more": False,
+        })
     
     except Exception as e:
         raise HTTPException(
@@ -194,7 +208,7 @@ async def get_shared_with_me_documents(
     description="Get document by ID. User must have access to document."
 )
 async def get_document(
-    document_id: str,
+    document_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -215,14 +229,14 @@ async def get_document(
     
     try:
         document = await service.get_document(
-            document_id,
-            str(current_user.id)
+            str(document_id),
+            str(current_user.id),
+            with_creator=True
         )
         
-        # Load creator relationship
-        await db.refresh(document, ["created_by"])
-        
-        return DocumentDetail(
+        # Trusted ORM data: build without validation (response_model
+        # serialization still runs, so this skips only the redundant pass)
+        return DocumentDetail.model_construct(
             id=str(document.id),
             title=document.title,
             slug=document.slug,
@@ -239,7 +253,7 @@ async def get_document(
             yjs_version=document.yjs_version,
             yjs_state_b64=base64.b64encode(document.yjs_state).decode('utf-8') if document.yjs_state else None,
             word_count=document.word_count,
-            created_by=DocumentCreator(
+            created_by=DocumentCreator.model_construct(
                 id=str(document.created_by.id),
                 username=document.created_by.username,
                 full_name=document.created_by.full_name
@@ -274,12 +288,12 @@ async def get_document(
 
 @router.get(
     "/workspace/{workspace_id}",
-    response_model=DocumentListResponse,
+    responses={200: {"model": DocumentListResponse}},
     summary="List documents",
     description="List documents in workspace with filtering and pagination."
 )
 async def list_documents(
-    workspace_id: str,
+    workspace_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     folder_id: Optional[str] = Query(None, description="Filter by folder"),
@@ -311,14 +325,16 @@ async def list_documents(
     """
     service = DocumentService(db)
     
-    # Parse tags
+    # Parse tags (one strip per tag; duplicates add nothing to an OR filter)
     tags_list = None
     if tags:
-        tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        tags_list = list(dict.fromkeys(
+            tag for tag in map(str.strip, tags.split(",")) if tag
+        ))
     
     try:
         documents, total = await service.list_documents(
-            workspace_id,
+            str(workspace_id),
             str(current_user.id),
             page=page,
             page_size=page_size,
@@ -330,33 +346,13 @@ async def list_documents(
             sort_order=sort_order
         )
         
-        items = [
-            DocumentListItem(
-                id=str(doc.id),
-                title=doc.title,
-                slug=doc.slug,
-                content_type=doc.content_type,
-                workspace_id=str(doc.workspace_id),
-                folder_id=str(doc.folder_id) if doc.folder_id else None,
-                tags=doc.tags,
-                is_starred=doc.is_starred,
-                storage_mode=doc.storage_mode.value,
-                version=doc.version,
-                yjs_version=doc.yjs_version,
-                word_count=doc.word_count,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at
-            )
-            for doc in documents
-        ]
-        
-        return DocumentListResponse(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-            has_more=(page * page_size) < total
-        )
+        return ORJSONResponse({
+            "items": [_list_item(doc) for doc in documents],
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "has_more": (page * page_size) < total,
+        })
     
     except ValueError as e:
         error_msg = str(e).lower()
@@ -389,7 +385,7 @@ async def list_documents(
     description="Update document. Only creator or workspace owner can update."
 )
 async def update_document(
-    document_id: str,
+    document_id: UUID,
     document_data: DocumentUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -410,7 +406,7 @@ async def update_document(
     
     try:
         document = await service.update_document(
-            document_id,
+            str(document_id),
             document_data,
             str(current_user.id)
         )
@@ -463,7 +459,7 @@ async def update_document(
     description="Delete document (soft delete). Only creator or workspace owner can delete."
 )
 async def delete_document(
-    document_id: str,
+    document_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -487,7 +483,7 @@ async def delete_document(
     
     try:
         await service.delete_document(
-            document_id,
+            str(document_id),
             str(current_user.id)
         )
         
@@ -528,7 +524,7 @@ async def delete_document(
     description="Star document for quick access. Only creator can star."
 )
 async def star_document(
-    document_id: str,
+    document_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -547,7 +543,7 @@ async def star_document(
     
     try:
         document = await service.star_document(
-            document_id,
+            str(document_id),
             str(current_user.id)
         )
         
@@ -588,7 +584,7 @@ async def star_document(
     description="Remove star from document. Only creator can unstar."
 )
 async def unstar_document(
-    document_id: str,
+    document_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -607,7 +603,7 @@ async def unstar_document(
     
     try:
         document = await service.unstar_document(
-            document_id,
+            str(document_id),
             str(current_user.id)
         )
         
@@ -651,7 +647,7 @@ async def unstar_document(
     summary="Save document snapshot"
 )
 async def save_snapshot(
-    document_id: str,
+    document_id: UUID,
     snapshot_data: dict,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -677,7 +673,7 @@ async def save_snapshot(
         )
         
         await service.update_document(
-            document_id=document_id,
+            document_id=str(document_id),
             document_data=update_data,
             user_id=str(current_user.id)
         )
@@ -697,7 +693,7 @@ async def save_snapshot(
     summary="Fetch document snapshot"
 )
 async def fetch_snapshot(
-    document_id: str,
+    document_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -705,7 +701,7 @@ async def fetch_snapshot(
     service = DocumentService(db)
     
     try:
-        document = await service.get_document(document_id=document_id, user_id=str(current_user.id))
+        document = await service.get_document(document_id=str(document_id), user_id=str(current_user.id))
         
         if not document.yjs_state:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No snapshot found")
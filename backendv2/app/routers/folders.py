@@ -14,6 +14,7 @@ Pattern: Three-Layer Architecture (Router Layer)
 
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -25,7 +26,6 @@ from app.schemas.folder import (
     FolderUpdate,
     FolderMove,
     FolderResponse,
-    FolderListItem,
     FolderListResponse,
     FolderTreeNode,
     FolderTreeResponse
@@ -37,6 +37,21 @@ router = APIRouter(
 )
 
 
+def _list_item(folder) -> dict:
+    """Folder list item as a plain dict (FolderListItem shape)"""
+    return {
+        "id": str(folder.id),
+        "workspace_id": str(folder.workspace_id),
+        "name": folder.name,
+        "icon": folder.icon,
+        "color": folder.color,
+        "parent_id": str(folder.parent_id) if folder.parent_id else None,
+        "position": folder.position,
+        "document_count": getattr(folder, "document_count", 0),
+        "created_at": folder.created_at,
+    }
+
+
 @router.post(
     "",
     response_model=FolderResponse,
@@ -111,7 +126,7 @@ async def create_folder(
 
 @router.get(
     "/workspace/{workspace_id}",
-    response_model=FolderListResponse,
+    responses={200: {"model": FolderListResponse}},
     summary="List folders",
     description="List folders in workspace (API_CONTRACTS.md 5.2)"
 )
@@ -142,22 +157,10 @@ async def list_folders(
             parent_id=parent_id
         )
         
-        items = [
-            FolderListItem(
-                id=str(f.id),
-                workspace_id=str(f.workspace_id),
-                name=f.name,
-                icon=f.icon,
-                color=f.color,
-                parent_id=str(f.parent_id) if f.parent_id else None,
-                position=f.position,
-                document_count=getattr(f, 'document_count', 0),
-                created_at=f.created_at
-            )
-            for f in folders
-        ]
-        
-        return FolderListResponse(items=items, total=total)
+        return ORJSONResponse({
+            "items": [_list_item(f) for f in folders],
+            "total": total,
+        })
     
     except ValueError as e:
         error_msg = str(e)
@@ -205,30 +208,13 @@ async def get_folder_tree(
         )
         
         def build_tree_node(folder) -> FolderTreeNode:
-            """Recursively build tree node"""
-            # Access children from manually set attribute (not SQLAlchemy relationship)
-            folder_children = []
-            if hasattr(folder, 'children') and isinstance(folder.children, list):
-                folder_children = folder.children
-            
-            children = [
-                build_tree_node(child)
-                for child in folder_children
-            ]
-            
-            return FolderTreeNode(
-                id=str(folder.id),
-                name=folder.name,
-                icon=folder.icon,
-                color=folder.color,
-                parent_id=str(folder.parent_id) if folder.parent_id else None,
-                position=folder.position,
-                children=children
-            )
+            """Build tree node bottom-up (children first, no validation)"""
+            children = [build_tree_node(child) for child in folder.children]
+            return FolderTreeNode.from_orm_trusted(folder, children)
         
         tree_nodes = [build_tree_node(f) for f in root_folders]
         
-        return FolderTreeResponse(folders=tree_nodes)
+        return FolderTreeResponse.model_construct(folders=tree_nodes)
     
     except ValueError as e:
         error_msg = str(e)
@@ -29,6 +29,7 @@ from app.schemas.share import (
     DocumentShareResponse,
     InvitationResponse
 )
+from app.services.auth_service import AuthService
 from app.services.share_service import ShareService
 
 
@@ -154,16 +155,14 @@ async def list_members(
             actor_id=current_user.id
         )
         
-        # Format members (join user data)
-        from sqlalchemy import select
-        from app.models.user import User as UserModel
+        # Format members (user data for all members in one query)
+        users = await AuthService(db).get_users_by_ids(
+            member.principal_id for member in members
+        )
         
         member_responses = []
         for member in members:
-            # Get user info
-            user_query = select(UserModel).where(UserModel.id == member.principal_id)
-            user_result = await db.execute(user_query)
-            user = user_result.scalar_one_or_none()
+            user = users.get(str(member.principal_id))
             
             member_responses.append({
                 "id": member.id,
@@ -179,12 +178,10 @@ async def list_members(
                 "user_name": user.full_name if user else None
             })
         
-        # Format invitations (join inviter data)
+        # Format invitations (inviter already loaded)
         invitation_responses = []
         for invitation in invitations:
-            inviter_query = select(UserModel).where(UserModel.id == invitation.invited_by)
-            inviter_result = await db.execute(inviter_query)
-            inviter = inviter_result.scalar_one_or_none()
+            inviter = invitation.inviter  # joinedloaded by list_members
             
             invitation_responses.append({
                 "id": invitation.id,
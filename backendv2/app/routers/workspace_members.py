@@ -23,14 +23,12 @@ from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
 
 from app.database import get_db
 from app.routers.auth import get_current_user
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.workspace_member import WorkspaceMember, WorkspaceRole
-from app.models.document import Document
 from app.schemas.workspace_member import (
     AddWorkspaceMemberRequest,
     ChangeWorkspaceMemberRoleRequest,
@@ -38,7 +36,8 @@ from app.schemas.workspace_member import (
     WorkspaceMemberResponse,
     WorkspaceMemberListResponse,
     UserWorkspaceResponse,
-    UserWorkspaceListResponse
+    UserWorkspaceListResponse,
+    WorkspaceRoleEnum
 )
 from app.services.workspace_member_service import WorkspaceMemberService
 
@@ -46,6 +45,26 @@ from app.services.workspace_member_service import WorkspaceMemberService
 router = APIRouter(prefix="/api/v1", tags=["workspace-members"])
 
 
+def _member_response(membership: WorkspaceMember) -> WorkspaceMemberResponse:
+    """WorkspaceMemberResponse from a trusted ORM row (no validation)"""
+    user = membership.user
+    return WorkspaceMemberResponse.model_construct(
+        id=membership.id,
+        workspace_id=membership.workspace_id,
+        user_id=membership.user_id,
+        email=user.email if user else None,
+        username=user.username if user else None,
+        full_name=user.full_name if user else None,
+        role=WorkspaceRoleEnum(membership.role.value),
+        granted_by=membership.granted_by,
+        granted_at=membership.granted_at,
+        expires_at=membership.expires_at,
+        status=membership.status,
+        created_at=membership.created_at,
+        updated_at=membership.updated_at
+    )
+
+
 # ============================================================================
 # Add Member
 # ============================================================================
@@ -99,21 +118,7 @@ async def add_workspace_member(
         await db.refresh(membership)
         
         # Build response
-        return WorkspaceMemberResponse(
-            id=membership.id,
-            workspace_id=membership.workspace_id,
-            user_id=membership.user_id,
-            email=membership.user.email if membership.user else None,
-            username=membership.user.username if membership.user else None,
-            full_name=membership.user.full_name if membership.user else None,
-            role=membership.role.value,
-            granted_by=membership.granted_by,
-            granted_at=membership.granted_at,
-            expires_at=membership.expires_at,
-            status=membership.status,
-            created_at=membership.created_at,
-            updated_at=membership.updated_at
-        )
+        return _member_response(membership)
         
     except ValueError as e:
         error_msg = str(e).lower()
@@ -169,26 +174,9 @@ async def list_workspace_members(
         )
         
         # Build response
-        member_responses = [
-            WorkspaceMemberResponse(
-                id=m.id,
-                workspace_id=m.workspace_id,
-                user_id=m.user_id,
-                email=m.user.email if m.user else None,
-                username=m.user.username if m.user else None,
-                full_name=m.user.full_name if m.user else None,
-                role=m.role.value,
-                granted_by=m.granted_by,
-                granted_at=m.granted_at,
-                expires_at=m.expires_at,
-                status=m.status,
-                created_at=m.created_at,
-                updated_at=m.updated_at
-            )
-            for m in members
-        ]
+        member_responses = [_member_response(m) for m in members]
         
-        return WorkspaceMemberListResponse(
+        return WorkspaceMemberListResponse.model_construct(
             data=member_responses,
             total=len(member_responses),
             workspace_id=workspace_id
@@ -311,21 +299,7 @@ async def change_workspace_member_role(
         await db.refresh(membership)
         
         # Build response
-        return WorkspaceMemberResponse(
-            id=membership.id,
-            workspace_id=membership.workspace_id,
-            user_id=membership.user_id,
-            email=membership.user.email if membership.user else None,
-            username=membership.user.username if membership.user else None,
-            full_name=membership.user.full_name if membership.user else None,
-            role=membership.role.value,
-            granted_by=membership.granted_by,
-            granted_at=membership.granted_at,
-            expires_at=membership.expires_at,
-            status=membership.status,
-            created_at=membership.created_at,
-            updated_at=membership.updated_at
-        )
+        return _member_response(membership)
         
     except ValueError as e:
         error_msg = str(e).lower()
@@ -414,40 +388,25 @@ async def get_user_workspaces(
             user_id=current_user.id
         )
         
-        # Get member count and document count for each workspace
+        # Member and document counts for all workspaces (batched, no N+1)
+        counts = await WorkspaceMemberService.get_workspace_counts(
+            db=db,
+            workspace_ids=[workspace.id for workspace, _ in workspaces_with_roles]
+        )
+        
         workspace_responses = []
         for workspace, role in workspaces_with_roles:
-            # Count members
-            member_count_result = await db.execute(
-                select(func.count())
-                .select_from(WorkspaceMember)
-                .where(
-                    WorkspaceMember.workspace_id == workspace.id,
-                    WorkspaceMember.status == "active"
-                )
-            )
-            member_count = member_count_result.scalar() or 0
-            
-            # Count documents
-            doc_count_result = await db.execute(
-                select(func.count())
-                .select_from(Document)
-                .where(
-                    Document.workspace_id == workspace.id,
-                    Document.is_deleted == False
-                )
-            )
-            document_count = doc_count_result.scalar() or 0
+            member_count, document_count = counts[workspace.id]
             
             workspace_responses.append(
-                UserWorkspaceResponse(
+                UserWorkspaceResponse.model_construct(
                     id=workspace.id,
                     name=workspace.name,
                     slug=workspace.slug,
                     description=workspace.description,
                     icon=workspace.icon,
                     owner_id=workspace.owner_id,
-                    role=role.value,
+                    role=WorkspaceRoleEnum(role.value),
                     member_count=member_count,
                     document_count=document_count,
                     created_at=workspace.created_at,
@@ -455,7 +414,8 @@ async def get_user_workspaces(
                 )
             )
         
-        return UserWorkspaceListResponse(
+        # Trusted rows: build without validation (as in list_members)
+        return UserWorkspaceListResponse.model_construct(
             data=workspace_responses,
             total=len(workspace_responses)
         )
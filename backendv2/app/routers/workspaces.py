@@ -15,7 +15,9 @@ Success Rate: 98% (PATTERNS_ADOPTION.md)
 """
 
 from typing import List
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -32,11 +34,49 @@ from app.schemas.workspace import (
     WorkspaceStats,
 )
 from app.services.workspace_service import WorkspaceService
+from app.services.workspace_member_service import WorkspaceMemberService
 
 
 router = APIRouter(prefix="/api/v1/workspaces", tags=["Workspaces"])
 
 
+def _workspace_response(workspace: Workspace) -> WorkspaceResponse:
+    """
+    WorkspaceResponse from a trusted ORM row, built without validation
+    
+    response_model still serializes the result; model_construct only skips
+    re-validating data we just loaded from our own DB.
+    """
+    return WorkspaceResponse.model_construct(
+        id=str(workspace.id),
+        name=workspace.name,
+        slug=workspace.slug,
+        description=workspace.description,
+        icon=workspace.icon,
+        is_public=workspace.is_public,
+        owner_id=str(workspace.owner_id),
+        created_at=workspace.created_at,
+        updated_at=workspace.updated_at
+    )
+
+
+def _list_item(workspace: Workspace, member_count: int, document_count: int) -> dict:
+    """Workspace list item as a plain dict (WorkspaceResponse shape)"""
+    return {
+        "id": str(workspace.id),
+        "name": workspace.name,
+        "slug": workspace.slug,
+        "description": workspace.description,
+        "icon": workspace.icon,
+        "is_public": workspace.is_public,
+        "owner_id": str(workspace.owner_id),
+        "created_at": workspace.created_at,
+        "updated_at": workspace.updated_at,
+        "document_count": document_count,
+        "member_count": member_count,
+    }
+
+
 # =========================================
 # Create Workspace
 # =========================================
@@ -79,17 +119,7 @@ async def create_workspace(
             str(current_user.id)
         )
         
-        return WorkspaceResponse(
-            id=str(workspace.id),
-            name=workspace.name,
-            slug=workspace.slug,
-            description=workspace.description,
-            icon=workspace.icon,
-            is_public=workspace.is_public,
-            owner_id=str(workspace.owner_id),
-            created_at=workspace.created_at,
-            updated_at=workspace.updated_at
-        )
+        return _workspace_response(workspace)
         
     except ValueError as e:
         raise HTTPException(
@@ -104,7 +134,7 @@ async def create_workspace(
 
 @router.get(
     "",
-    response_model=WorkspaceListResponse,
+    responses={200: {"model": WorkspaceListResponse}},
     summary="List workspaces",
     description="List all workspaces owned by the current user (paginated)"
 )
@@ -142,36 +172,22 @@ async def list_workspaces(
         include_archived=include_archived
     )
     
-    # Get stats for each workspace
-    items = []
-    for workspace in workspaces:
-        stats = await service.get_workspace_stats(str(workspace.id))
-        
-        items.append(
-            WorkspaceResponse(
-                id=str(workspace.id),
-                name=workspace.name,
-                slug=workspace.slug,
-                description=workspace.description,
-                icon=workspace.icon,
-                is_public=workspace.is_public,
-                owner_id=str(workspace.owner_id),
-                document_count=stats["document_count"],
-                member_count=stats["member_count"],
-                created_at=workspace.created_at,
-                updated_at=workspace.updated_at
-            )
-        )
+    # Member and document counts for the whole page (batched, no N+1)
+    counts = await WorkspaceMemberService.get_workspace_counts(
+        db=db,
+        workspace_ids=[workspace.id for workspace in workspaces]
+    )
+    items = [_list_item(workspace, *counts[workspace.id]) for workspace in workspaces]
     
     has_more = (page * page_size) < total
     
-    return WorkspaceListResponse(
-        items=items,
-        total=total,
-        page=page,
-        page_size=page_size,
-        has_more=has_more
-    )
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "has_more": has_more,
+    })
 
 
 # =========================================
@@ -185,7 +201,7 @@ async def list_workspaces(
     description="Get workspace details including owner and statistics"
 )
 async def get_workspace(
-    workspace_id: str,
+    workspace_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -203,7 +219,7 @@ async def get_workspace(
     service = WorkspaceService(db)
     
     workspace = await service.get_workspace(
-        workspace_id=workspace_id,
+        workspace_id=str(workspace_id),
         user_id=str(current_user.id)
     )
     
@@ -214,7 +230,7 @@ async def get_workspace(
         )
     
     # Get owner info
-    owner = WorkspaceOwner(
+    owner = WorkspaceOwner.model_construct(
         id=str(workspace.owner.id),
         username=workspace.owner.username,
         full_name=workspace.owner.full_name,
@@ -223,9 +239,10 @@ async def get_workspace(
     
     # Get stats
     stats_dict = await service.get_workspace_stats(str(workspace.id))
-    stats = WorkspaceStats(**stats_dict)
+    stats = WorkspaceStats.model_construct(**stats_dict)
     
-    return WorkspaceDetail(
+    # Trusted ORM data: construct without validation (see _workspace_response)
+    return WorkspaceDetail.model_construct(
         id=str(workspace.id),
         name=workspace.name,
         slug=workspace.slug,
@@ -250,7 +267,7 @@ async def get_workspace(
     description="Update workspace (owner only). All fields optional."
 )
 async def update_workspace(
-    workspace_id: str,
+    workspace_id: UUID,
     update_data: WorkspaceUpdate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -276,7 +293,7 @@ async def update_workspace(
     
     try:
         workspace = await service.update_workspace(
-            workspace_id=workspace_id,
+            workspace_id=str(workspace_id),
             user_id=str(current_user.id),
             update_data=update_data
         )
@@ -287,17 +304,7 @@ async def update_workspace(
                 detail="Workspace not found"
             )
         
-        return WorkspaceResponse(
-            id=str(workspace.id),
-            name=workspace.name,
-            slug=workspace.slug,
-            description=workspace.description,
-            icon=workspace.icon,
-            is_public=workspace.is_public,
-            owner_id=str(workspace.owner_id),
-            created_at=workspace.created_at,
-            updated_at=workspace.updated_at
-        )
+        return _workspace_response(workspace)
         
     except ValueError as e:
         raise HTTPException(
@@ -317,7 +324,7 @@ async def update_workspace(
     description="Delete workspace (owner only). Soft delete."
 )
 async def delete_workspace(
-    workspace_id: str,
+    workspace_id: UUID,
     cascade: bool = Query(
         False,
         description="Delete all documents and folders"
@@ -344,7 +351,7 @@ async def delete_workspace(
     
     try:
         deleted = await service.delete_workspace(
-            workspace_id=workspace_id,
+            workspace_id=str(workspace_id),
             user_id=str(current_user.id),
             cascade=cascade
         )
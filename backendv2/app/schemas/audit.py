@@ -28,8 +28,7 @@ class AuditLogResponse(BaseModel):
     actor_name: Optional[str] = None
     actor_email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class AuditLogListResponse(BaseModel):
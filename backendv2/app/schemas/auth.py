@@ -13,13 +13,20 @@ API Contract: API_CONTRACTS.md - Section 2 (Authentication Endpoints)
 
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field, field_validator
-import re
 
 
 # =========================================
 # Password Validation (SECURITY_CHECKLIST.md)
 # =========================================
 
+# Character-class bits for the single-pass complexity scan
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT | _HAS_SPECIAL
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+_RESERVED_USERNAMES = frozenset({"admin", "root", "system", "null", "undefined"})
+
+
 def validate_password_complexity(password: str) -> str:
     """
     Validate password meets security requirements
@@ -34,16 +41,33 @@ def validate_password_complexity(password: str) -> str:
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters long")
     
-    if not re.search(r'[A-Z]', password):
+    # One pass over the password, stopping once every class has been seen
+    # (same classes as the old regexes: ASCII letters, \d digits, specials)
+    classes = 0
+    for ch in password:
+        if "A" <= ch <= "Z":
+            classes |= _HAS_UPPER
+        elif "a" <= ch <= "z":
+            classes |= _HAS_LOWER
+        elif ch.isdecimal():
+            classes |= _HAS_DIGIT
+        elif ch in _SPECIAL_CHARS:
+            classes |= _HAS_SPECIAL
+        else:
+            continue
+        if classes == _ALL_CLASSES:
+            break
+    
+    if not classes & _HAS_UPPER:
         raise ValueError("Password must contain at least one uppercase letter")
     
-    if not re.search(r'[a-z]', password):
+    if not classes & _HAS_LOWER:
         raise ValueError("Password must contain at least one lowercase letter")
     
-    if not re.search(r'\d', password):
+    if not classes & _HAS_DIGIT:
         raise ValueError("Password must contain at least one digit")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not classes & _HAS_SPECIAL:
         raise ValueError("Password must contain at least one special character")
     
     return password
@@ -103,8 +127,7 @@ class UserRegister(BaseModel):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username is not reserved"""
-        reserved = ["admin", "root", "system", "null", "undefined"]
-        if v.lower() in reserved:
+        if v.lower() in _RESERVED_USERNAMES:
             raise ValueError(f"Username '{v}' is reserved")
         return v
 
@@ -165,8 +188,16 @@ class UserResponse(BaseModel):
     created_at: str = Field(..., description="Account creation timestamp (ISO 8601)")
     updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
     
-    class Config:
-        from_attributes = True  # Pydantic v2 (was orm_mode in v1)
+    model_config = {"from_attributes": True}
+    
+    @classmethod
+    def from_orm_trusted(cls, user) -> "UserResponse":
+        """
+        Build from a User row without validation
+        
+        Trusted DB data only - never use for request input.
+        """
+        return cls.model_construct(**user.to_dict())
 
 
 # =========================================
@@ -48,6 +48,35 @@ class SortOrder(str, Enum):
     DESC = "desc"
 
 
+# =========================================
+# Tag Cleaning
+# =========================================
+
+MAX_TAGS = 20
+MAX_TAG_LENGTH = 50
+
+
+def clean_tags(tags: List[str]) -> List[str]:
+    """
+    Strip, drop empty and de-duplicate tags in one pass (order preserved)
+    
+    Raises:
+        ValueError: More than MAX_TAGS distinct tags, or a tag longer
+            than MAX_TAG_LENGTH (checked as soon as it is seen)
+    """
+    seen = {}
+    for tag in tags:
+        tag = tag.strip()
+        if not tag or tag in seen:
+            continue
+        if len(tag) > MAX_TAG_LENGTH:
+            raise ValueError(f"Each tag must be max {MAX_TAG_LENGTH} characters")
+        if len(seen) == MAX_TAGS:
+            raise ValueError(f"Maximum {MAX_TAGS} tags allowed")
+        seen[tag] = None
+    return list(seen)
+
+
 # =========================================
 # Request Schemas (Input)
 # =========================================
@@ -123,13 +152,8 @@ class DocumentCreate(BaseModel):
     @field_validator('tags')
     @classmethod
     def validate_tags(cls, v: List[str]) -> List[str]:
-        """Validate tags (max 20 tags, each max 50 chars)"""
-        if len(v) > 20:
-            raise ValueError("Maximum 20 tags allowed")
-        for tag in v:
-            if len(tag) > 50:
-                raise ValueError("Each tag must be max 50 characters")
-        return v
+        """Clean and validate tags (max 20 tags, each max 50 chars)"""
+        return clean_tags(v)
     
     model_config = {
         "json_schema_extra": {
@@ -199,13 +223,9 @@ class DocumentUpdate(BaseModel):
     @field_validator('tags')
     @classmethod
     def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Validate tags"""
+        """Clean and validate tags (max 20 tags, each max 50 chars)"""
         if v is not None:
-            if len(v) > 20:
-                raise ValueError("Maximum 20 tags allowed")
-            for tag in v:
-                if len(tag) > 50:
-                    raise ValueError("Each tag must be max 50 characters")
+            return clean_tags(v)
         return v
     
     model_config = {
@@ -318,6 +338,7 @@ class DocumentDetail(BaseModel):
     
     model_config = {
         "from_attributes": True,
+        "defer_build": True,  # Only built via model_construct; skip eager validator
         "json_schema_extra": {
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
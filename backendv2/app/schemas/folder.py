@@ -17,6 +17,10 @@ from datetime import datetime
 import re
 
 
+# Compiled once; \Z (unlike $) does not accept a trailing newline
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}\Z')
+
+
 # =========================================
 # Request Schemas
 # =========================================
@@ -44,7 +48,7 @@ class FolderCreate(BaseModel):
         """Validate hex color code"""
         if v is None:
             return v
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', v):
+        if not _HEX_COLOR_RE.match(v):
             raise ValueError('Color must be a valid hex code (e.g., #3b82f6)')
         return v
 
@@ -66,7 +70,7 @@ class FolderUpdate(BaseModel):
         """Validate hex color code"""
         if v is None:
             return v
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', v):
+        if not _HEX_COLOR_RE.match(v):
             raise ValueError('Color must be a valid hex code (e.g., #3b82f6)')
         return v
 
@@ -148,7 +152,26 @@ class FolderTreeNode(BaseModel):
     position: int
     children: List['FolderTreeNode'] = []
     
-    model_config = {"from_attributes": True}
+    # Recursive schema: built on first use instead of at import
+    model_config = {"from_attributes": True, "defer_build": True}
+    
+    @classmethod
+    def from_orm_trusted(cls, folder, children: List["FolderTreeNode"]) -> "FolderTreeNode":
+        """
+        Build from a folder tree row without validation
+        
+        Trusted DB data only. children must already be built nodes, so a
+        tree built bottom-up is never validated level by level.
+        """
+        return cls.model_construct(
+            id=str(folder.id),
+            name=folder.name,
+            icon=folder.icon,
+            color=folder.color,
+            parent_id=str(folder.parent_id) if folder.parent_id else None,
+            position=folder.position,
+            children=children,
+        )
 
 
 class FolderTreeResponse(BaseModel):
@@ -158,3 +181,5 @@ class FolderTreeResponse(BaseModel):
     Contract: API_CONTRACTS.md 5.3
     """
     folders: List[FolderTreeNode]
+    
+    model_config = {"defer_build": True}
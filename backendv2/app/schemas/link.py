@@ -69,8 +69,7 @@ class ShareLinkResponse(BaseModel):
     is_active: bool = True
     is_expired: bool = False
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class CreateShareLinkResponse(BaseModel):
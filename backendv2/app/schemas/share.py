@@ -88,8 +88,7 @@ class DocumentShareResponse(BaseModel):
     user_email: Optional[str] = None
     user_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class MemberListResponse(BaseModel):
@@ -97,8 +96,7 @@ class MemberListResponse(BaseModel):
     members: List[DocumentShareResponse]
     pending_invites: List['InvitationResponse']
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class InviteCreatedResponse(BaseModel):
@@ -116,8 +114,7 @@ class InviteUsersResponse(BaseModel):
     invited: List[InviteCreatedResponse]
     errors: List[dict] = Field(default_factory=list, description="Any errors during invitation")
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class InvitationResponse(BaseModel):
@@ -134,8 +131,7 @@ class InvitationResponse(BaseModel):
     inviter_name: Optional[str] = None
     inviter_email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class AcceptInvitationResponse(BaseModel):
@@ -163,8 +159,7 @@ class APIResponse(BaseModel):
     data: Optional[dict] = None
     error: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 # Rebuild models to resolve forward references
@@ -98,16 +98,14 @@ class SnapshotMetadataResponse(BaseModel):
     creator_name: Optional[str] = None
     creator_email: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class SnapshotDetailResponse(SnapshotMetadataResponse):
     """Response for snapshot detail (includes preview)"""
     html_preview: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class SnapshotListResponse(BaseModel):
@@ -17,6 +17,10 @@ from datetime import datetime
 import re
 
 
+# Compiled once; \Z (unlike $) does not accept a trailing newline
+_SLUG_RE = re.compile(r'^[a-z0-9-]+\Z')
+
+
 # =========================================
 # Request Schemas (Input)
 # =========================================
@@ -75,7 +79,7 @@ class WorkspaceCreate(BaseModel):
     def validate_slug(cls, v: Optional[str]) -> Optional[str]:
         """Validate slug format (lowercase, alphanumeric, hyphens only)"""
         if v is not None:
-            if not re.match(r'^[a-z0-9-]+$', v):
+            if not _SLUG_RE.match(v):
                 raise ValueError(
                     "Slug must contain only lowercase letters, numbers, and hyphens"
                 )
@@ -224,6 +228,7 @@ class WorkspaceDetail(BaseModel):
     
     model_config = {
         "from_attributes": True,
+        "defer_build": True,  # Only built via model_construct; skip eager validator
         "json_schema_extra": {
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
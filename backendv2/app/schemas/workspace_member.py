@@ -83,8 +83,7 @@ class WorkspaceMemberResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class WorkspaceMemberListResponse(BaseModel):
@@ -108,8 +107,7 @@ class UserWorkspaceResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = {"from_attributes": True}
 
 
 class UserWorkspaceListResponse(BaseModel):
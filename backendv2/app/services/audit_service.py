@@ -9,7 +9,7 @@ Purpose: Audit logging for sharing, permissions, and snapshot actions
 from typing import Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import select, desc, func
 from datetime import datetime
 
 from app.models.audit_log import AuditLog
@@ -85,12 +85,12 @@ class AuditService:
         result = await db.execute(query)
         logs = result.scalars().all()
         
-        # Count total
-        count_query = select(AuditLog).where(
+        # Count total (COUNT(*) - don't load every log row just to len() it)
+        count_query = select(func.count()).select_from(AuditLog).where(
             AuditLog.document_id == document_id
         )
         count_result = await db.execute(count_query)
-        total = len(count_result.scalars().all())
+        total = count_result.scalar() or 0
         
         return logs, total
 
@@ -11,19 +11,23 @@ Security: SECURITY_CHECKLIST.md compliant
 Success Rate: 99%
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.orm import defer
 from datetime import timedelta
 import asyncio
+import uuid
 
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserLogin
 from app.utils.security import (
     hash_password,
     verify_password,
+    dummy_verify_password,
     create_access_token,
     create_refresh_token,
+    parse_user_id,
 )
 from app.config import settings
 
@@ -83,26 +87,22 @@ class AuthService:
         - Email is unique
         - Username is unique
         """
-        # 1. Check if email already exists
-        result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
+        # 1-2. Check if email / username already exist
+        #      (one round trip, EXISTS only - no user rows are loaded)
+        email_taken, username_taken = await self.email_username_taken(
+            user_data.email, user_data.username
         )
-        existing_user = result.scalars().first()
         
-        if existing_user:
+        if email_taken:
             raise ValueError(f"Email '{user_data.email}' is already registered")
         
-        # 2. Check if username already exists
-        result = await self.db.execute(
-            select(User).where(User.username == user_data.username)
-        )
-        existing_user = result.scalars().first()
-        
-        if existing_user:
+        if username_taken:
             raise ValueError(f"Username '{user_data.username}' is already taken")
         
         # 3. Hash password (SECURITY_CHECKLIST.md - bcrypt 12 rounds)
-        hashed_password = hash_password(user_data.password)
+        #    bcrypt is ~0.25s of CPU; run it off the event loop so other
+        #    requests keep being served meanwhile
+        hashed_password = await asyncio.to_thread(hash_password, user_data.password)
         
         # 4. Create user
         new_user = User(
@@ -114,8 +114,7 @@ class AuthService:
         )
         
         self.db.add(new_user)
-        await self.db.commit()
-        await self.db.refresh(new_user)
+        await self.db.commit()  # expire_on_commit=False: no reload needed
         
         # 5. Generate tokens
         access_token = create_access_token({"sub": str(new_user.id)})
@@ -167,25 +166,36 @@ class AuthService:
         Security:
         - Rate limited (handled by middleware)
         - Password verified with bcrypt
+        - Unknown emails cost the same bcrypt time (dummy hash)
         - Account active check
         """
-        # 1. Find user by email
+        # 1. Find user by email (unique - stop at the first row)
         result = await self.db.execute(
-            select(User).where(
+            select(User)
+            .where(
                 User.email == login_data.email,
-                User.is_deleted == False
+                User.is_deleted.is_(False)
             )
+            .limit(1)
         )
-        user = result.scalars().first()
+        user = result.scalar_one_or_none()
         
         if not user:
+            # Same bcrypt cost as a real check: timing must not tell
+            # registered emails apart from unknown ones
+            await asyncio.to_thread(dummy_verify_password)
             raise ValueError("Invalid email or password")
         
-        # 2. Verify password (bcrypt)
-        if not verify_password(login_data.password, user.hashed_password):
+        # 2. Verify password (bcrypt, off the event loop)
+        password_ok = await asyncio.to_thread(
+            verify_password, login_data.password, user.hashed_password
+        )
+        if not password_ok:
             raise ValueError("Invalid email or password")
         
         # 3. Check if account is active
+        #    Only after the password: checking first would skip bcrypt for
+        #    suspended accounts and disclose their status to anyone
         if not user.is_active:
             raise ValueError("Account is suspended. Please contact support.")
         
@@ -227,14 +237,8 @@ class AuthService:
         - Refresh token should be rotated (single-use)
         - Old refresh token should be blacklisted (Phase 1: Redis)
         """
-        # 1. Find user
-        result = await self.db.execute(
-            select(User).where(
-                User.id == user_id,
-                User.is_deleted == False
-            )
-        )
-        user = result.scalars().first()
+        # 1. Find user (primary-key lookup, identity map first)
+        user = await self.get_user_by_id(user_id)
         
         if not user:
             raise ValueError("User not found")
@@ -260,21 +264,80 @@ class AuthService:
     # Get User by ID
     # =========================================
     
-    async def get_user_by_id(self, user_id: str) -> Optional[User]:
+    async def email_username_taken(self, email: str, username: str) -> tuple[bool, bool]:
+        """
+        Check email and username availability in a single query
+        
+        Args:
+            email: Email address
+            username: Username
+            
+        Returns:
+            Tuple of (email_taken, username_taken)
+        """
+        result = await self.db.execute(
+            select(
+                exists().where(User.email == email),
+                exists().where(User.username == username),
+            )
+        )
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
+    
+    async def get_user_by_id(self, user_id: Union[str, uuid.UUID]) -> Optional[User]:
         """
         Get user by ID
         
+        Uses Session.get() so a user already in the session's identity map
+        is returned without emitting SQL (hot path: get_current_user).
+        The password hash is deferred - nothing downstream of authentication
+        reads it (login loads users through its own query).
+        
         Args:
-            user_id: User ID (UUID)
+            user_id: User ID (UUID or its string form)
             
         Returns:
             User object or None if not found
         """
+        if isinstance(user_id, uuid.UUID):
+            user_uuid = user_id
+        else:
+            try:
+                user_uuid = parse_user_id(user_id)
+            except ValueError:
+                return None
+        
+        user = await self.db.get(
+            User,
+            user_uuid,
+            options=[defer(User.hashed_password)],
+        )
+        if user is None or user.is_deleted:
+            return None
+        return user
+    
+    async def get_users_by_ids(
+        self, user_ids: Iterable[Union[str, uuid.UUID]]
+    ) -> Dict[str, User]:
+        """
+        Get several users in one query
+        
+        For list endpoints that decorate rows with user info, instead of
+        one lookup per row. Deleted users are left out, like get_user_by_id.
+        
+        Args:
+            user_ids: User IDs (UUIDs or their string forms, duplicates ok)
+            
+        Returns:
+            Dict mapping str(user.id) -> User
+        """
+        ids = {str(user_id) for user_id in user_ids if user_id is not None}
+        if not ids:
+            return {}
+        
         result = await self.db.execute(
-            select(User).where(
-                User.id == user_id,
-                User.is_deleted == False
-            )
+            select(User)
+            .where(User.id.in_(ids), User.is_deleted.is_(False))
+            .options(defer(User.hashed_password))
         )
-        return result.scalars().first()
-
+        return {str(user.id): user for user in result.scalars()}
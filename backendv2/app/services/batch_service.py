@@ -40,6 +40,13 @@ class BatchService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.document_service = DocumentService(db)
+        
+        # Operation type -> handler (one dict lookup per operation)
+        self._handlers = {
+            BatchOperationType.CREATE: self._handle_create,
+            BatchOperationType.UPDATE: self._handle_update,
+            BatchOperationType.DELETE: self._handle_delete,
+        }
     
     async def process_batch(
         self,
@@ -131,22 +138,16 @@ class BatchService:
         Returns:
             BatchOperationResult with status and details
         """
+        handler = self._handlers.get(operation.operation)
+        if handler is None:
+            return BatchOperationResult(
+                client_id=operation.client_id,
+                status=BatchOperationStatus.ERROR,
+                error=f"Unknown operation type: {operation.operation}"
+            )
+        
         try:
-            if operation.operation == BatchOperationType.CREATE:
-                return await self._handle_create(workspace_id, operation, user_id)
-            
-            elif operation.operation == BatchOperationType.UPDATE:
-                return await self._handle_update(workspace_id, operation, user_id, id_mapping)
-            
-            elif operation.operation == BatchOperationType.DELETE:
-                return await self._handle_delete(operation, user_id, id_mapping)
-            
-            else:
-                return BatchOperationResult(
-                    client_id=operation.client_id,
-                    status=BatchOperationStatus.ERROR,
-                    error=f"Unknown operation type: {operation.operation}"
-                )
+            return await handler(workspace_id, operation, user_id, id_mapping)
         
         except ValueError as e:
             error_msg = str(e).lower()
@@ -185,7 +186,8 @@ class BatchService:
         self,
         workspace_id: str,
         operation: BatchDocumentOperation,
-        user_id: str
+        user_id: str,
+        id_mapping: dict
     ) -> BatchOperationResult:
         """Handle CREATE operation"""
         if not operation.data or not isinstance(operation.data, DocumentCreate):
@@ -253,6 +255,7 @@ class BatchService:
     
     async def _handle_delete(
         self,
+        workspace_id: str,
         operation: BatchDocumentOperation,
         user_id: str,
         id_mapping: dict
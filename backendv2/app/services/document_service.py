@@ -12,7 +12,9 @@ Pattern: Three-Layer Architecture (Service layer)
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc, asc
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select, update, and_, or_, func, desc, asc
 from typing import Optional, List
 import uuid as uuid_lib
 import re
@@ -26,6 +28,11 @@ from app.models.document_share import DocumentShare
 from app.schemas.document import DocumentCreate, DocumentUpdate, SortBy, SortOrder
 
 
+# Slug generation patterns (compiled once)
+_SLUG_INVALID_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+
 class DocumentService:
     """
     Document service
@@ -65,8 +72,8 @@ class DocumentService:
         - Max 200 chars
         """
         slug = title.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _SLUG_INVALID_RE.sub('', slug)
+        slug = _SLUG_SEPARATOR_RE.sub('-', slug)
         slug = slug.strip('-')
         return slug[:200]
     
@@ -273,32 +280,37 @@ class DocumentService:
             )
             
             self.db.add(document)
-            await self.db.commit()
-            await self.db.refresh(document)
+            await self.db.commit()  # expire_on_commit=False: no reload needed
             
             return document
     
     async def get_document(
         self,
         document_id: str,
-        user_id: str
+        user_id: str,
+        with_creator: bool = False
     ) -> Document:
         """
         Get document by ID
         
         Checks access: owner, public document, or explicit document share
         
+        Args:
+            with_creator: Eager-load created_by in the same query
+        
         Raises:
             ValueError: If document not found or no access
         """
-        result = await self.db.execute(
-            select(Document).where(
-                and_(
-                    Document.id == document_id,
-                    Document.is_deleted == False
-                )
+        query = select(Document).where(
+            and_(
+                Document.id == document_id,
+                Document.is_deleted == False
             )
         )
+        if with_creator:
+            query = query.options(joinedload(Document.created_by))
+        
+        result = await self.db.execute(query)
         document = result.scalars().first()
         
         if not document:
@@ -376,10 +388,8 @@ class DocumentService:
         if is_template is not None:
             query = query.where(Document.is_template == is_template)
         
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        # Keep the filtered query for a COUNT fallback (see below)
+        filtered_query = query
         
         # Apply sorting
         if sort_by == SortBy.UPDATED_AT:
@@ -394,14 +404,31 @@ class DocumentService:
         else:
             query = query.order_by(asc(sort_col))
         
-        # Apply pagination
-        query = query.offset((page - 1) * page_size).limit(page_size)
+        # Apply pagination (one extra row tells us whether more pages exist)
+        offset = (page - 1) * page_size
+        query = query.offset(offset).limit(page_size + 1)
         
         # Execute
         result = await self.db.execute(query)
-        documents = result.scalars().all()
+        documents = list(result.scalars().all())
+        
+        # Total: on the last page it is simply offset + rows returned, so the
+        # COUNT(*) round trip is only needed when more rows follow (or the
+        # page is past the end and returned nothing)
+        if len(documents) > page_size:
+            documents = documents[:page_size]
+            total = None
+        elif documents or page == 1:
+            total = offset + len(documents)
+        else:
+            total = None
+        
+        if total is None:
+            count_query = select(func.count()).select_from(filtered_query.subquery())
+            total_result = await self.db.execute(count_query)
+            total = total_result.scalar() or 0
         
-        return list(documents), total
+        return documents, total
     
     async def update_document(
         self,
@@ -562,82 +589,89 @@ class DocumentService:
         
         await self.db.commit()
     
-    async def star_document(
+    async def _set_starred(
         self,
         document_id: str,
-        user_id: str
-    ) -> Document:
+        user_id: str,
+        starred: bool
+    ) -> Row:
         """
-        Star document
+        Flip is_starred with a single UPDATE ... RETURNING
         
-        Only document creator can star
+        The creator/not-deleted checks live in the WHERE clause, so the
+        happy path is one round trip. Only when no row matches do we look
+        the document up again to pick the right error.
+        
+        Returns:
+            Row with id, is_starred, updated_at
         
         Raises:
             ValueError: If document not found or not creator
         """
-        # Get document
         result = await self.db.execute(
-            select(Document).where(
+            update(Document)
+            .where(
                 and_(
                     Document.id == document_id,
+                    Document.created_by_id == user_id,
                     Document.is_deleted == False
                 )
             )
+            .values(is_starred=starred)
+            .returning(Document.id, Document.is_starred, Document.updated_at)
         )
-        document = result.scalars().first()
+        row = result.first()
         
-        if not document:
-            raise ValueError("Document not found")
+        if row is None:
+            exists_result = await self.db.execute(
+                select(Document.id).where(
+                    and_(
+                        Document.id == document_id,
+                        Document.is_deleted == False
+                    )
+                )
+            )
+            if exists_result.first() is None:
+                raise ValueError("Document not found")
+            action = "star" if starred else "unstar"
+            raise ValueError(f"Only document creator can {action}")
+        
+        await self.db.commit()
         
-        # Check if creator
-        if str(document.created_by_id) != user_id:
-            raise ValueError("Only document creator can star")
+        return row
+    
+    async def star_document(
+        self,
+        document_id: str,
+        user_id: str
+    ) -> Row:
+        """
+        Star document
         
-        # Star
-        document.is_starred = True
-        document.updated_at = datetime.utcnow()
+        Only document creator can star
         
-        await self.db.commit()
-        await self.db.refresh(document)
+        Returns:
+            Row with id, is_starred, updated_at
         
-        return document
+        Raises:
+            ValueError: If document not found or not creator
+        """
+        return await self._set_starred(document_id, user_id, True)
     
     async def unstar_document(
         self,
         document_id: str,
         user_id: str
-    ) -> Document:
+    ) -> Row:
         """
         Unstar document
         
         Only document creator can unstar
         
+        Returns:
+            Row with id, is_starred, updated_at
+        
         Raises:
             ValueError: If document not found or not creator
         """
-        # Get document
-        result = await self.db.execute(
-            select(Document).where(
-                and_(
-                    Document.id == document_id,
-                    Document.is_deleted == False
-                )
-            )
-        )
-        document = result.scalars().first()
-        
-        if not document:
-            raise ValueError("Document not found")
-        
-        # Check if creator
-        if str(document.created_by_id) != user_id:
-            raise ValueError("Only document creator can unstar")
-        
-        # Unstar
-        document.is_starred = False
-        document.updated_at = datetime.utcnow()
-        
-        await self.db.commit()
-        await self.db.refresh(document)
-        
-        return document
+        return await self._set_starred(document_id, user_id, False)
@@ -13,7 +13,9 @@ Pattern: Three-Layer Architecture (Service Layer)
 """
 
 from typing import Optional, List, Set
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, update, and_, func
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import uuid as uuid_lib
@@ -222,8 +224,7 @@ class FolderService:
         )
         
         self.db.add(folder)
-        await self.db.commit()
-        await self.db.refresh(folder)
+        await self.db.commit()  # expire_on_commit=False: no reload needed
         
         return folder
     
@@ -310,47 +311,75 @@ class FolderService:
         # Check workspace access
         await self._check_workspace_access(workspace_id, user_id, require_owner=False)
         
-        # Get all folders in workspace
-        result = await self.db.execute(
-            select(Folder).where(
+        # Walk the live hierarchy in one round trip (recursive CTE). Only
+        # folders reachable from a live root come back, so children of a
+        # soft-deleted folder are excluded, and ordering by the position
+        # path guarantees every parent row precedes its children.
+        roots = (
+            select(
+                Folder.id,
+                Folder.name,
+                Folder.icon,
+                Folder.color,
+                Folder.parent_id,
+                Folder.position,
+                array([Folder.position]).label("path")
+            )
+            .where(
                 and_(
                     Folder.workspace_id == workspace_id,
+                    Folder.parent_id.is_(None),
                     Folder.is_deleted == False
                 )
-            ).order_by(Folder.position.asc())
+            )
+            .cte("folder_tree", recursive=True)
+        )
+        child = aliased(Folder)
+        tree = roots.union_all(
+            select(
+                child.id,
+                child.name,
+                child.icon,
+                child.color,
+                child.parent_id,
+                child.position,
+                roots.c.path.concat(child.position)
+            )
+            .join(roots, child.parent_id == roots.c.id)
+            .where(child.is_deleted == False)
+        )
+        result = await self.db.execute(
+            select(
+                tree.c.id,
+                tree.c.name,
+                tree.c.icon,
+                tree.c.color,
+                tree.c.parent_id,
+                tree.c.position
+            ).order_by(tree.c.path)
         )
-        all_folders = list(result.scalars().all())
         
         # Convert to simple objects to avoid SQLAlchemy relationship issues
         from types import SimpleNamespace
         
-        folder_objects = []
-        for f in all_folders:
-            folder_obj = SimpleNamespace(
-                id=f.id,
-                name=f.name,
-                icon=f.icon,
-                color=f.color,
-                parent_id=f.parent_id,
-                position=f.position,
+        # Single pass: parents are always seen before their children
+        folder_map = {}
+        root_folders = []
+        for row in result:
+            folder = SimpleNamespace(
+                id=row.id,
+                name=row.name,
+                icon=row.icon,
+                color=row.color,
+                parent_id=row.parent_id,
+                position=row.position,
                 children=[]
             )
-            folder_objects.append(folder_obj)
-        
-        # Build folder map
-        folder_map = {str(f.id): f for f in folder_objects}
-        
-        # Build tree structure
-        root_folders = []
-        
-        # Build parent-child relationships
-        for folder in folder_objects:
-            if folder.parent_id is None:
+            folder_map[row.id] = folder
+            if row.parent_id is None:
                 root_folders.append(folder)
             else:
-                parent = folder_map.get(str(folder.parent_id))
-                if parent:
-                    parent.children.append(folder)
+                folder_map[row.parent_id].children.append(folder)
         
         return root_folders
     
@@ -507,7 +536,7 @@ class FolderService:
             folder_id: Folder ID
             workspace_id: Workspace ID
             user_id: User ID
-            cascade: If True, delete all documents in folder
+            cascade: If True, also delete documents in the folder and its subfolders
         
         Raises:
             ValueError: Folder not found, not empty, or no permission
@@ -530,11 +559,26 @@ class FolderService:
         if not folder:
             raise ValueError("Folder not found")
         
-        # Check if folder has documents
+        # Folder plus every live descendant (recursive CTE), so subfolders
+        # are deleted with their parent instead of being left orphaned
+        subtree = (
+            select(Folder.id)
+            .where(Folder.id == folder.id)
+            .cte("folder_subtree", recursive=True)
+        )
+        child = aliased(Folder)
+        subtree = subtree.union_all(
+            select(child.id)
+            .join(subtree, child.parent_id == subtree.c.id)
+            .where(child.is_deleted == False)
+        )
+        subtree_ids = select(subtree.c.id)
+        
+        # Check if the subtree has documents
         doc_count_result = await self.db.execute(
             select(func.count(Document.id)).where(
                 and_(
-                    Document.folder_id == folder_id,
+                    Document.folder_id.in_(subtree_ids),
                     Document.is_deleted == False
                 )
             )
@@ -544,23 +588,24 @@ class FolderService:
         if doc_count > 0 and not cascade:
             raise ValueError("Folder is not empty. Use cascade=true to delete all documents.")
         
-        # Delete documents if cascade
-        if cascade and doc_count > 0:
-            documents_result = await self.db.execute(
-                select(Document).where(
+        # Soft delete documents and folders with one UPDATE each
+        # (updated_at is set by the column's onupdate)
+        if doc_count > 0:
+            await self.db.execute(
+                update(Document)
+                .where(
                     and_(
-                        Document.folder_id == folder_id,
+                        Document.folder_id.in_(subtree_ids),
                         Document.is_deleted == False
                     )
                 )
+                .values(is_deleted=True)
             )
-            documents = documents_result.scalars().all()
-            for doc in documents:
-                doc.is_deleted = True
-                doc.updated_at = datetime.utcnow()
         
-        # Soft delete folder
-        folder.is_deleted = True
-        folder.updated_at = datetime.utcnow()
+        await self.db.execute(
+            update(Folder)
+            .where(Folder.id.in_(subtree_ids))
+            .values(is_deleted=True)
+        )
         
         await self.db.commit()
@@ -13,7 +13,7 @@ Role Hierarchy: owner > admin > editor > viewer
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Sequence, Tuple
 from uuid import UUID
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +22,7 @@ from sqlalchemy.orm import joinedload
 from app.models.workspace import Workspace
 from app.models.workspace_member import WorkspaceMember, WorkspaceRole
 from app.models.user import User
+from app.models.document import Document
 from app.services.audit_service import AuditService
 
 
@@ -58,24 +59,19 @@ class WorkspaceMemberService:
         Raises:
             ValueError: If user lacks required role or not a member
         """
-        # Get user's role in workspace
-        result = await db.execute(
-            select(WorkspaceMember)
-            .where(
-                WorkspaceMember.workspace_id == workspace_id,
-                WorkspaceMember.user_id == user_id,
-                WorkspaceMember.status == "active"
-            )
+        # Get user's role in workspace (role column only - no ORM object;
+        # served by the unique (workspace_id, user_id) index)
+        role = await WorkspaceMemberService.get_workspace_role(
+            db, user_id, workspace_id
         )
-        membership = result.scalar_one_or_none()
         
-        if not membership:
+        if role is None:
             raise ValueError("Forbidden: Not a workspace member")
         
-        if membership.role < required_role:
+        if role < required_role:
             raise ValueError(f"Forbidden: Requires {required_role.value} role")
         
-        return membership.role
+        return role
     
     @staticmethod
     async def get_workspace_role(
@@ -160,7 +156,6 @@ class WorkspaceMemberService:
             user_id=user_id,
             role=role,
             granted_by=granted_by,
-            granted_at=datetime.utcnow(),
             expires_at=expires_at,
             status="active"
         )
@@ -393,7 +388,6 @@ class WorkspaceMemberService:
                 user_id=new_owner_id,
                 role=WorkspaceRole.OWNER,
                 granted_by=current_owner_id,
-                granted_at=datetime.utcnow(),
                 status="active"
             )
             db.add(new_owner_membership)
@@ -453,4 +447,50 @@ class WorkspaceMemberService:
             .order_by(Workspace.created_at.desc())
         )
         return list(result.all())
-
+    
+    @staticmethod
+    async def get_workspace_counts(
+        db: AsyncSession,
+        workspace_ids: Sequence[UUID]
+    ) -> Dict[UUID, Tuple[int, int]]:
+        """
+        Get active member and document counts for many workspaces at once.
+        
+        Two grouped queries regardless of how many workspaces are passed
+        (instead of two COUNT queries per workspace).
+        
+        Args:
+            db: Database session
+            workspace_ids: Workspaces to count
+            
+        Returns:
+            Dict of workspace_id -> (member_count, document_count);
+            workspaces without rows map to (0, 0)
+        """
+        counts: Dict[UUID, Tuple[int, int]] = {ws_id: (0, 0) for ws_id in workspace_ids}
+        if not counts:
+            return counts
+        
+        member_rows = await db.execute(
+            select(WorkspaceMember.workspace_id, func.count())
+            .where(
+                WorkspaceMember.workspace_id.in_(counts.keys()),
+                WorkspaceMember.status == "active"
+            )
+            .group_by(WorkspaceMember.workspace_id)
+        )
+        for ws_id, member_count in member_rows:
+            counts[ws_id] = (member_count, 0)
+        
+        document_rows = await db.execute(
+            select(Document.workspace_id, func.count())
+            .where(
+                Document.workspace_id.in_(counts.keys()),
+                Document.is_deleted == False
+            )
+            .group_by(Document.workspace_id)
+        )
+        for ws_id, document_count in document_rows:
+            counts[ws_id] = (counts[ws_id][0], document_count)
+        
+        return counts
@@ -25,9 +25,16 @@ from app.models.workspace import Workspace
 from app.models.user import User
 from app.models.document import Document
 from app.models.folder import Folder
+from app.models.workspace_member import WorkspaceMember
 from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate
 
 
+# Slug generation patterns (compiled once)
+_WHITESPACE_RE = re.compile(r'\s+')
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
+
 class WorkspaceService:
     """
     Workspace Service
@@ -158,8 +165,6 @@ class WorkspaceService:
         )
         
         self.db.add(workspace)
-        await self.db.commit()
-        await self.db.refresh(workspace)
         
         # 🔥 BUG FIX #12: Automatically add owner as workspace member
         # This ensures the owner has immediate access to their own workspace
@@ -171,8 +176,10 @@ class WorkspaceService:
             status="active"
         )
         self.db.add(owner_member)
+        
+        # Single transaction for workspace + owner membership;
+        # expire_on_commit=False keeps both objects loaded (no reload needed)
         await self.db.commit()
-        await self.db.refresh(owner_member)
         
         return workspace
     
@@ -449,27 +456,45 @@ class WorkspaceService:
         Returns:
             Dict with document_count, folder_count, member_count, storage_used_bytes
         """
-        # Count documents
-        result = await self.db.execute(
-            select(func.count(Document.id)).where(
+        # All counts in one round trip (scalar subqueries)
+        document_count = (
+            select(func.count())
+            .select_from(Document)
+            .where(
                 and_(
                     Document.workspace_id == workspace_id,
                     Document.is_deleted == False
                 )
             )
+            .scalar_subquery()
         )
-        document_count = result.scalar() or 0
-        
-        # Count folders
-        result = await self.db.execute(
-            select(func.count(Folder.id)).where(
+        folder_count = (
+            select(func.count())
+            .select_from(Folder)
+            .where(
                 and_(
                     Folder.workspace_id == workspace_id,
                     Folder.is_deleted == False
                 )
             )
+            .scalar_subquery()
+        )
+        member_count = (
+            select(func.count())
+            .select_from(WorkspaceMember)
+            .where(
+                and_(
+                    WorkspaceMember.workspace_id == workspace_id,
+                    WorkspaceMember.status == "active"
+                )
+            )
+            .scalar_subquery()
+        )
+        
+        result = await self.db.execute(
+            select(document_count, folder_count, member_count)
         )
-        folder_count = result.scalar() or 0
+        document_count, folder_count, member_count = result.one()
         
         # TODO: Calculate storage_used_bytes (sum of document sizes)
         storage_used_bytes = 0
@@ -477,7 +502,7 @@ class WorkspaceService:
         return {
             "document_count": document_count,
             "folder_count": folder_count,
-            "member_count": 1,  # TODO: Phase 1 - workspace members
+            "member_count": member_count,
             "storage_used_bytes": storage_used_bytes
         }
     
@@ -505,13 +530,13 @@ class WorkspaceService:
         slug = name.lower()
         
         # Replace spaces with hyphens
-        slug = re.sub(r'\s+', '-', slug)
+        slug = _WHITESPACE_RE.sub('-', slug)
         
         # Remove special characters (keep alphanumeric and hyphens)
-        slug = re.sub(r'[^a-z0-9-]', '', slug)
+        slug = _SLUG_INVALID_RE.sub('', slug)
         
         # Remove multiple consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
+        slug = _HYPHEN_RUN_RE.sub('-', slug)
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
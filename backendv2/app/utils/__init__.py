@@ -11,7 +11,10 @@ from app.utils.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
+    verify_token_fast,
+    clear_token_cache,
     get_token_user_id,
+    parse_user_id,
 )
 
 __all__ = [
@@ -20,6 +23,9 @@ __all__ = [
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "verify_token_fast",
+    "clear_token_cache",
     "get_token_user_id",
+    "parse_user_id",
 ]
 
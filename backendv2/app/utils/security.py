@@ -10,11 +10,16 @@ Patterns: SECURITY_CHECKLIST.md
 Success Rate: 99%+ (Production-proven)
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 import secrets
+import threading
+import time
+import uuid
 
 from app.config import settings
 
@@ -75,6 +80,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def dummy_verify_password() -> bool:
+    """
+    Spend the same bcrypt time as verify_password, against a dummy hash
+    
+    Used when no user matches the login email, so response time does not
+    reveal which emails are registered. Always returns False.
+    """
+    return pwd_context.dummy_verify()
+
+
 # =========================================
 # JWT Token Generation (SECURITY_CHECKLIST.md - Section 1.1)
 # =========================================
@@ -226,6 +241,110 @@ def get_token_user_id(token: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=4096)
+def parse_user_id(user_id: str) -> uuid.UUID:
+    """
+    Parse a token's sub claim into a UUID
+    
+    Cached because the same handful of users hit the API over and over.
+    
+    Args:
+        user_id: User ID string (sub claim)
+        
+    Returns:
+        UUID instance
+        
+    Raises:
+        ValueError: If user_id is not a valid UUID
+    """
+    return uuid.UUID(user_id)
+
+
+# =========================================
+# Verified Token Cache (hot path: get_current_user)
+# =========================================
+# Every authenticated request presents the same access token many times
+# within a few seconds. Verifying the signature each time is pure CPU
+# overhead, so successful verifications are kept for a short TTL.
+#
+# Only the token's identity is cached - the user row is still loaded per
+# request, so suspending or deleting an account takes effect immediately.
+
+VerifiedToken = Tuple[uuid.UUID, float]  # (user id, exp timestamp)
+
+# Keyed by the token string itself: dict lookup hashes it natively and
+# confirms hits with a full equality check, so there is no digest to
+# compute per request and no collision risk.
+_token_cache: "OrderedDict[str, Tuple[float, VerifiedToken]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _verify_access_token(token: str) -> Optional[VerifiedToken]:
+    """Decode once and extract (user UUID, exp) from a valid access token"""
+    try:
+        payload = decode_token(token)
+        user_id = payload.get("sub")
+        if user_id is None or payload.get("type") != "access":
+            return None
+        return parse_user_id(user_id), float(payload["exp"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+
+def verify_token_fast(token: str) -> Optional[VerifiedToken]:
+    """
+    Verify an access token and return its user id and expiry
+    
+    Single pass over the token: signature, expiry, token type and sub
+    claim are checked and the sub is parsed into a UUID. Results are
+    cached for TOKEN_CACHE_TTL_SECONDS (never past the token's exp);
+    invalid tokens are never cached.
+    
+    Args:
+        token: JWT access token string
+        
+    Returns:
+        (user_uuid, exp) tuple, or None if the token is not a valid
+        access token
+        
+    Example:
+        >>> token = create_access_token({"sub": str(uuid.uuid4())})
+        >>> user_uuid, exp = verify_token_fast(token)
+    """
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return _verify_access_token(token)
+    
+    now = time.time()
+    
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            del _token_cache[token]
+    
+    verified = _verify_access_token(token)
+    if verified is None:
+        return None
+    
+    # Never serve a cached result beyond the token's expiry
+    cached_until = min(now + ttl, verified[1])
+    
+    with _token_cache_lock:
+        _token_cache[token] = (cached_until, verified)
+        while len(_token_cache) > settings.TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return verified
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token verifications (tests, secret rotation)"""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
 # =========================================
 # Token Blacklist (Phase 1: Redis)
 # =========================================
@@ -10,6 +10,7 @@ Fixtures:
 - test_user: Authenticated test user
 - auth_headers: Authorization headers
 - test_workspace: Test workspace
+- workspace_with_member: Owner + viewer memberships on test_workspace
 """
 
 import pytest
@@ -323,6 +324,43 @@ async def public_workspace(test_db: AsyncSession, test_user_2: User) -> Workspac
     return workspace
 
 
+@pytest.fixture(scope="function")
+async def workspace_with_member(
+    test_db: AsyncSession,
+    test_workspace: Workspace,
+    test_user: User,
+    test_user_2: User
+):
+    """
+    Add memberships to test_workspace: test_user as owner, test_user_2 as viewer
+    
+    Returns:
+        test_user_2's WorkspaceMember row (tests may change its role)
+    
+    Scope: function
+    """
+    from app.models.workspace_member import WorkspaceMember, WorkspaceRole
+    
+    owner = WorkspaceMember(
+        workspace_id=test_workspace.id,
+        user_id=test_user.id,
+        role=WorkspaceRole.OWNER,
+        granted_by=test_user.id,
+        status="active"
+    )
+    member = WorkspaceMember(
+        workspace_id=test_workspace.id,
+        user_id=test_user_2.id,
+        role=WorkspaceRole.VIEWER,
+        granted_by=test_user.id,
+        status="active"
+    )
+    
+    test_db.add_all([owner, member])
+    await test_db.commit()
+    return member
+
+
 # =========================================
 # Document Fixtures
 # =========================================
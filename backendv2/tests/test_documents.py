@@ -170,6 +170,33 @@ async def test_create_document_validation_errors(
     assert response.status_code == 422
 
 
+@pytest.mark.integration
+@pytest.mark.document
+@pytest.mark.asyncio
+async def test_create_document_cleans_tags(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_workspace: Workspace
+):
+    """
+    Test POST /api/v1/documents tag cleaning
+    
+    - Tags are stripped; empty and duplicate tags dropped (order kept)
+    - Duplicates do not count toward the 20-tag limit
+    """
+    response = await client.post(
+        f"/api/v1/documents?workspace_id={test_workspace.id}",
+        json={
+            "title": "Tagged",
+            "tags": [" work", "work", "", "draft ", "work"] + ["bulk"] * 30
+        },
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 201
+    assert response.json()["tags"] == ["work", "draft", "bulk"]
+
+
 @pytest.mark.integration
 @pytest.mark.document
 @pytest.mark.asyncio
@@ -302,6 +329,26 @@ async def test_get_document_not_found(
     assert response.status_code == 404
 
 
+@pytest.mark.integration
+@pytest.mark.document
+@pytest.mark.asyncio
+async def test_get_document_malformed_id(
+    client: AsyncClient,
+    auth_headers: dict
+):
+    """
+    Test GET /api/v1/documents/{id} with a malformed ID
+    
+    - Error: 422 from path validation (no DB query)
+    """
+    response = await client.get(
+        "/api/v1/documents/not-a-uuid",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 422
+
+
 @pytest.mark.integration
 @pytest.mark.document
 @pytest.mark.asyncio
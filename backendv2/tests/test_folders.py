@@ -380,6 +380,11 @@ async def test_get_folder_tree_success(
     root_folder = data["folders"][0]
     assert "children" in root_folder
     assert isinstance(root_folder["children"], list)
+    
+    parent = next(f for f in data["folders"] if f["id"] == str(test_folder.id))
+    assert [c["name"] for c in parent["children"]] == ["Subfolder"]
+    assert parent["children"][0]["parent_id"] == str(test_folder.id)
+    assert parent["children"][0]["children"] == []
 
 
 @pytest.mark.integration
@@ -802,6 +807,69 @@ async def test_delete_folder_not_empty(
     assert response.status_code == 400
 
 
+@pytest.mark.integration
+@pytest.mark.folder
+@pytest.mark.asyncio
+async def test_delete_folder_cascades_to_subfolders(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_workspace: Workspace
+):
+    """
+    Test DELETE /api/v1/folders/{folder_id} (nested)
+    
+    - Subfolders are soft-deleted with their parent
+    - Documents in subfolders count toward "not empty"
+    """
+    parent_response = await client.post(
+        f"/api/v1/folders?workspace_id={test_workspace.id}",
+        json={"name": "Parent"},
+        headers=auth_headers
+    )
+    parent_id = parent_response.json()["id"]
+    
+    child_response = await client.post(
+        f"/api/v1/folders?workspace_id={test_workspace.id}",
+        json={"name": "Child", "parent_id": parent_id},
+        headers=auth_headers
+    )
+    child_id = child_response.json()["id"]
+    
+    await client.post(
+        f"/api/v1/documents?workspace_id={test_workspace.id}",
+        json={"title": "Nested Doc", "folder_id": child_id},
+        headers=auth_headers
+    )
+    
+    # Nested document blocks a non-cascading delete
+    response = await client.delete(
+        f"/api/v1/folders/{parent_id}?workspace_id={test_workspace.id}",
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    
+    response = await client.delete(
+        f"/api/v1/folders/{parent_id}?workspace_id={test_workspace.id}&cascade=true",
+        headers=auth_headers
+    )
+    assert response.status_code == 204
+    
+    # Child folder and its document are gone too
+    list_response = await client.get(
+        f"/api/v1/folders/workspace/{test_workspace.id}",
+        headers=auth_headers
+    )
+    folder_ids = [f["id"] for f in list_response.json()["items"]]
+    assert parent_id not in folder_ids
+    assert child_id not in folder_ids
+    
+    docs_response = await client.get(
+        f"/api/v1/documents/workspace/{test_workspace.id}",
+        headers=auth_headers
+    )
+    assert all(d["folder_id"] != child_id for d in docs_response.json()["items"])
+
+
 @pytest.mark.integration
 @pytest.mark.folder
 @pytest.mark.asyncio
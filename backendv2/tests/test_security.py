@@ -0,0 +1,69 @@
+"""
+Security Utility Tests
+======================
+
+Unit tests for token helpers in app.utils.security.
+
+Test Coverage:
+- Fast access-token verification (single pass + cache)
+- Dummy password verification (unknown-user login path)
+"""
+
+import uuid
+
+import pytest
+
+from app.utils import security
+from app.utils.security import (
+    clear_token_cache,
+    create_access_token,
+    create_refresh_token,
+    dummy_verify_password,
+    verify_token_fast,
+)
+
+
+# =========================================
+# Token Verification Tests
+# =========================================
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_verify_token_fast_returns_user_uuid_and_exp():
+    """Valid access token yields (UUID, exp) and is cached"""
+    clear_token_cache()
+    user_id = uuid.uuid4()
+    token = create_access_token({"sub": str(user_id)})
+
+    first = verify_token_fast(token)
+    second = verify_token_fast(token)
+
+    assert first is not None
+    assert first[0] == user_id
+    assert first[1] > 0
+    assert second is first
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_verify_token_fast_rejects_invalid_tokens():
+    """Garbage, refresh tokens and non-UUID subjects are rejected, never cached"""
+    clear_token_cache()
+
+    assert verify_token_fast("not-a-jwt") is None
+    assert verify_token_fast(create_refresh_token(str(uuid.uuid4()))) is None
+    assert verify_token_fast(create_access_token({"sub": "user-123"})) is None
+
+    assert len(security._token_cache) == 0
+
+
+# =========================================
+# Password Verification Tests
+# =========================================
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_dummy_verify_password_never_matches():
+    """Dummy verification runs bcrypt but always fails"""
+    assert dummy_verify_password() is False
+    assert dummy_verify_password() is False
@@ -340,6 +340,10 @@ async def test_list_members_success(client: AsyncClient, test_db: AsyncSession,
     assert len(data["members"]) == 2
     assert any(m["role"] == "owner" for m in data["members"])
     assert any(m["role"] == "editor" for m in data["members"])
+    
+    # User info is joined for every member
+    emails = {m["role"]: m["user_email"] for m in data["members"]}
+    assert emails == {"owner": test_user.email, "editor": test_user_2.email}
 
 
 # =========================================
@@ -282,6 +282,38 @@ async def test_list_members_non_member_forbidden(client: AsyncClient, auth_heade
     assert response.status_code == 403
 
 
+@pytest.mark.asyncio
+async def test_list_members_returns_user_info(
+    client: AsyncClient,
+    auth_headers_2,
+    test_workspace: Workspace,
+    test_user,
+    test_user_2,
+    workspace_with_member
+):
+    """
+    P0: Member list entries carry user info and role
+    
+    Expected: 200 OK, one entry per active membership
+    """
+    # List members as the viewer
+    response = await client.get(
+        f"/api/v1/workspaces/{test_workspace.id}/members",
+        headers=auth_headers_2
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["workspace_id"] == str(test_workspace.id)
+    
+    members = {m["user_id"]: m for m in data["data"]}
+    assert members[str(test_user.id)]["role"] == "owner"
+    assert members[str(test_user.id)]["email"] == test_user.email
+    assert members[str(test_user_2.id)]["role"] == "viewer"
+    assert members[str(test_user_2.id)]["username"] == test_user_2.username
+
+
 # ============================================================================
 # C. Remove Member
 # ============================================================================
@@ -798,3 +830,35 @@ async def test_deleted_workspace_not_returned(client: AsyncClient, auth_headers,
     assert workspace2_id in workspace_ids
     assert workspace1_id not in workspace_ids
 
+
+@pytest.mark.asyncio
+async def test_get_user_workspaces_includes_role_and_counts(
+    client: AsyncClient,
+    auth_headers_2,
+    test_db: AsyncSession,
+    test_workspace: Workspace,
+    workspace_with_member
+):
+    """
+    P0: User workspace entries carry the caller's role and counts
+    
+    Expected: 200 OK with the membership's role and live member count
+    """
+    # Promote test_user_2 from viewer to editor
+    workspace_with_member.role = WorkspaceRole.EDITOR
+    await test_db.commit()
+    
+    response = await client.get(
+        "/api/v1/users/me/workspaces",
+        headers=auth_headers_2
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    
+    workspace = data["data"][0]
+    assert workspace["id"] == str(test_workspace.id)
+    assert workspace["role"] == "editor"
+    assert workspace["member_count"] == 2
+    assert workspace["document_count"] == 0
@@ -146,6 +146,7 @@ async def test_create_workspace_validation_errors(
     Contract: API_CONTRACTS.md 3.1
     - Validation: name required, 1-100 chars
     - Validation: description max 500 chars
+    - Validation: slug lowercase letters, numbers, hyphens
     """
     # Empty name
     response = await client.post(
@@ -173,6 +174,15 @@ async def test_create_workspace_validation_errors(
         headers=auth_headers
     )
     assert response.status_code == 422
+    
+    # Invalid slug (uppercase, trailing newline)
+    for slug in ("Bad-Slug", "my-slug\n"):
+        response = await client.post(
+            "/api/v1/workspaces",
+            json={"name": "Valid Name", "slug": slug},
+            headers=auth_headers
+        )
+        assert response.status_code == 422
 
 
 @pytest.mark.integration
@@ -369,6 +379,41 @@ async def test_get_workspace_success(
     assert "storage_used_bytes" in data["stats"]
 
 
+@pytest.mark.integration
+@pytest.mark.workspace
+@pytest.mark.asyncio
+async def test_workspace_counts(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_workspace: Workspace,
+    test_workspace_2: Workspace,
+    test_document: any,
+    test_folder: any
+):
+    """
+    Test document/folder counts in list and detail responses
+    
+    - List counts are per workspace (batched for the whole page)
+    - Detail stats match the workspace's live rows
+    """
+    response = await client.get("/api/v1/workspaces", headers=auth_headers)
+    
+    assert response.status_code == 200
+    items = {item["id"]: item for item in response.json()["items"]}
+    assert items[str(test_workspace.id)]["document_count"] == 1
+    assert items[str(test_workspace_2.id)]["document_count"] == 0
+    
+    response = await client.get(
+        f"/api/v1/workspaces/{test_workspace.id}",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    stats = response.json()["stats"]
+    assert stats["document_count"] == 1
+    assert stats["folder_count"] == 1
+
+
 @pytest.mark.integration
 @pytest.mark.workspace
 @pytest.mark.permissions
@@ -393,6 +438,26 @@ async def test_get_workspace_not_found(
     assert response.status_code == 404
 
 
+@pytest.mark.integration
+@pytest.mark.workspace
+@pytest.mark.asyncio
+async def test_get_workspace_malformed_id(
+    client: AsyncClient,
+    auth_headers: dict
+):
+    """
+    Test GET /api/v1/workspaces/{workspace_id} with a malformed ID
+    
+    - Error: 422 from path validation (no DB query)
+    """
+    response = await client.get(
+        "/api/v1/workspaces/not-a-uuid",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 422
+
+
 @pytest.mark.integration
 @pytest.mark.workspace
 @pytest.mark.permissions